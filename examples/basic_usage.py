@@ -7,6 +7,7 @@ Shows how to connect, search, and export geographic data.
 """
 
 import asyncio
+import sys
 from wof_explorer import WOFConnector, WOFSearchFilters, PlaceCollection
 
 
@@ -33,20 +34,20 @@ async def basic_example():
     print(f"Found {cursor.total_count} neighborhoods")
     print(f"Showing first {len(cursor.places)} results:")
 
-    # 3. Display basic information
-    for place in cursor.places:
-        print(f"  - {place.name} (ID: {place.id})")
+    # 3. Display basic information (one write for the whole list)
+    sys.stdout.write("".join(f"  - {p.name} (ID: {p.id})\n" for p in cursor.places))
 
     # 4. Fetch with geometry for export
     print("\nFetching detailed data with geometry...")
     places_with_geometry = await cursor.fetch_all(include_geometry=True)
 
-    # 5. Create collection and export to GeoJSON
+    # 5. Create collection and size up the GeoJSON export. The estimate
+    # skips serialization; call collection.to_geojson_string() (or
+    # write_geojson(path)) when you need the GeoJSON itself.
     collection = PlaceCollection(places=places_with_geometry)
-    geojson = collection.to_geojson_string()
 
-    print(f"Generated GeoJSON with {len(places_with_geometry)} features")
-    print(f"GeoJSON size: {len(geojson):,} characters")
+    print(f"Prepared GeoJSON export with {len(places_with_geometry)} features")
+    print(f"Estimated GeoJSON size: ~{collection.estimated_geojson_bytes():,} bytes")
 
     # 6. Basic summary
     summary = collection.get_summary()
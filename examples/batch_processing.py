@@ -6,6 +6,7 @@ Demonstrates efficient batch operations and cursor patterns.
 """
 
 import asyncio
+import sys
 from wof_explorer import WOFConnector, WOFSearchFilters, WOFBatchCursor, PlaceCollection
 
 
@@ -25,8 +26,7 @@ async def batch_example():
     cities = await batch_cursor.fetch_all()
 
     print(f"Fetched {len(cities)} cities:")
-    for city in cities:
-        print(f"  - {city.name}")
+    sys.stdout.write("".join(f"  - {city.name}\n" for city in cities))
 
     # 2. Processing large result sets in chunks
     print("\nProcessing neighborhoods in chunks...")
@@ -42,16 +42,13 @@ async def batch_example():
 
     print(f"Found {cursor.total_count} neighborhoods to process")
 
-    # Fetch all places first
-    all_neighborhoods = await cursor.fetch_all()
-
     # Process in chunks of 10
     chunk_size = 10
     processed = 0
 
-    # Process the neighborhoods in chunks
-    for i in range(0, len(all_neighborhoods), chunk_size):
-        chunk = all_neighborhoods[i : i + chunk_size]
+    # Stream the neighborhoods in chunks rather than fetching them all up
+    # front, so only one chunk of full details is held at a time
+    async for chunk in cursor.iter_chunks(chunk_size):
         processed += len(chunk)
         print(f"  Processed chunk: {len(chunk)} places (total: {processed})")
 
@@ -66,17 +63,23 @@ async def batch_example():
 
     all_places = []
 
-    # Search multiple regions
+    # Search multiple regions concurrently - the searches are independent,
+    # so their round-trips overlap instead of running back to back
     regions = ["California", "New York", "Texas"]
 
-    for region in regions:
-        print(f"  Searching {region}...")
-        region_cursor = await connector.search(
-            WOFSearchFilters(
-                placetype="locality", region=region, is_current=True, limit=20
+    print(f"  Searching {', '.join(regions)}...")
+    region_cursors = await asyncio.gather(
+        *[
+            connector.search(
+                WOFSearchFilters(
+                    placetype="locality", region=region, is_current=True, limit=20
+                )
             )
-        )
+            for region in regions
+        ]
+    )
 
+    for region_cursor in region_cursors:
         all_places.extend(region_cursor.places)
 
     # 4. Analyze the aggregated collection
@@ -91,17 +94,20 @@ async def batch_example():
 
     if "by_ancestor" in summary:
         print("  By region:")
-        for region, stats in summary["by_ancestor"].items():
-            print(f"    {region}: {stats['count']} places")
+        sys.stdout.write(
+            "".join(
+                f"    {region}: {stats['count']} places\n"
+                for region, stats in summary["by_ancestor"].items()
+            )
+        )
 
     # 5. Export aggregated data
     print("\nExporting aggregated data...")
 
     # Export to different formats
-    geojson = collection.to_geojson_string()
     csv_data = collection.to_csv_string()
 
-    print(f"  GeoJSON: {len(geojson):,} characters")
+    print(f"  GeoJSON: ~{collection.estimated_geojson_bytes():,} bytes (estimated)")
     print(f"  CSV: {len(csv_data):,} characters")
 
     await connector.disconnect()
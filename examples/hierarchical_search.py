@@ -6,6 +6,7 @@ Demonstrates navigating geographic hierarchies using cursors.
 """
 
 import asyncio
+import sys
 from wof_explorer import WOFConnector, WOFSearchFilters, WOFHierarchyCursor
 
 
@@ -33,38 +34,56 @@ async def hierarchical_example():
     # 2. Create hierarchy cursor for navigation
     hierarchy = WOFHierarchyCursor(sf, connector)
 
-    # 3. Navigate up the hierarchy (ancestors)
-    print(f"\nAncestors of {sf.name}:")
-    ancestors = await hierarchy.fetch_ancestors()
+    # 3. Navigate up (ancestors) and down (descendants) the hierarchy, and
+    # find siblings (other localities in same county). The lookups are
+    # independent, so run them concurrently; the hierarchy cursor shares
+    # one ancestor lookup between them.
+    async def find_siblings():
+        ancestors = await hierarchy.fetch_ancestors()
+        county = next((a for a in ancestors if a.placetype == "county"), None)
+        if county is None:
+            return []
+        siblings_cursor = await connector.search(
+            WOFSearchFilters(placetype="locality", ancestor_id=county.id, limit=5)
+        )
+        return siblings_cursor.places
+
+    ancestors, neighborhoods, siblings = await asyncio.gather(
+        hierarchy.fetch_ancestors(),
+        hierarchy.fetch_descendants(
+            filters=WOFSearchFilters(placetype="neighbourhood", limit=10)
+        ),
+        find_siblings(),
+    )
 
-    for i, ancestor in enumerate(ancestors):
-        indent = "  " * i
-        print(f"{indent}- {ancestor.name} ({ancestor.placetype})")
+    print(f"\nAncestors of {sf.name}:")
+    sys.stdout.write(
+        "".join(
+            f"{'  ' * i}- {ancestor.name} ({ancestor.placetype})\n"
+            for i, ancestor in enumerate(ancestors)
+        )
+    )
 
-    # 4. Navigate down the hierarchy (descendants)
+    # 4. Descendants
     print(f"\nNeighborhoods in {sf.name}:")
-    neighborhoods = await hierarchy.fetch_descendants(
-        filters=WOFSearchFilters(placetype="neighbourhood", limit=10)
+    sys.stdout.write(
+        "".join(
+            f"  - {n.name} ({'current' if n.is_current else 'deprecated'})\n"
+            for n in neighborhoods
+        )
     )
 
-    for neighborhood in neighborhoods:
-        status = "current" if neighborhood.is_current else "deprecated"
-        print(f"  - {neighborhood.name} ({status})")
-
     print(f"\nFound {len(neighborhoods)} neighborhoods total")
 
-    # 5. Find siblings (other localities in same county)
+    # 5. Siblings
     print(f"\nOther cities near {sf.name}:")
-    if ancestors:
-        county = next((a for a in ancestors if a.placetype == "county"), None)
-        if county:
-            siblings_cursor = await connector.search(
-                WOFSearchFilters(placetype="locality", ancestor_id=county.id, limit=5)
-            )
-
-            for sibling in siblings_cursor.places:
-                if sibling.id != sf.id:  # Don't include SF itself
-                    print(f"  - {sibling.name}")
+    sys.stdout.write(
+        "".join(
+            f"  - {sibling.name}\n"
+            for sibling in siblings
+            if sibling.id != sf.id  # Don't include SF itself
+        )
+    )
 
     await connector.disconnect()
     print("\n✓ Hierarchical navigation complete!")
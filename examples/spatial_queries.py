@@ -6,17 +6,18 @@ Demonstrates bounding box searches and spatial filtering.
 """
 
 import asyncio
+import sys
+from typing import NamedTuple
 from wof_explorer import WOFConnector, WOFSearchFilters
 
 
-class BBox:
-    """Simple bounding box class for examples."""
+class BBox(NamedTuple):
+    """Bounding box in the (min_lon, min_lat, max_lon, max_lat) order filters use."""
 
-    def __init__(self, min_lat, max_lat, min_lon, max_lon):
-        self.min_lat = min_lat
-        self.max_lat = max_lat
-        self.min_lon = min_lon
-        self.max_lon = max_lon
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
 
 
 async def spatial_example():
@@ -25,37 +26,47 @@ async def spatial_example():
     connector = WOFConnector("whosonfirst-data-admin-us-latest.db")
     await connector.connect()
 
-    # 1. Bounding box search (San Francisco Bay Area)
-    print("Searching Bay Area with bounding box...")
-
     # Bay Area approximate bounds
     bay_area_bbox = BBox(min_lat=37.4, max_lat=37.9, min_lon=-122.6, max_lon=-122.0)
 
-    cursor = await connector.search(
-        WOFSearchFilters(placetype="locality", bbox=bay_area_bbox, is_current=True)
+    # Small bounding box around San Francisco center for the proximity search
+    sf_center_lat, sf_center_lon = 37.7749, -122.4194
+    proximity_bbox = BBox(
+        min_lat=sf_center_lat - 0.1,
+        max_lat=sf_center_lat + 0.1,
+        min_lon=sf_center_lon - 0.1,
+        max_lon=sf_center_lon + 0.1,
+    )
+
+    # The bbox and proximity searches are independent, so run them concurrently
+    print(
+        "Searching Bay Area with bounding box and places near San Francisco center..."
+    )
+    cursor, nearby_cursor = await asyncio.gather(
+        connector.search(
+            WOFSearchFilters(placetype="locality", bbox=bay_area_bbox, is_current=True)
+        ),
+        connector.search(
+            WOFSearchFilters(
+                placetype="neighbourhood", bbox=proximity_bbox, is_current=True, limit=5
+            )
+        ),
     )
 
-    print(f"Found {len(cursor.places)} cities in Bay Area:")
-    for place in cursor.places[:10]:  # Show first 10
-        print(f"  - {place.name}")
+    # 1. Bounding box search (San Francisco Bay Area)
+    print(f"\nFound {len(cursor.places)} cities in Bay Area:")
+    # Show first 10
+    sys.stdout.write("".join(f"  - {place.name}\n" for place in cursor.places[:10]))
 
     # 2. Fetch with geometry to analyze areas
     print("\nFetching geometry data...")
     places_with_geom = await cursor.fetch_all(include_geometry=True)
 
     # 3. Analyze the spatial data
-    total_area = 0
-    largest_city = None
-    largest_area = 0
-
-    for place in places_with_geom:
-        if hasattr(place, "area_sqkm") and place.area_sqkm:
-            area = float(place.area_sqkm)
-            total_area += area
-
-            if area > largest_area:
-                largest_area = area
-                largest_city = place
+    areas = [place.area_sqkm or 0.0 for place in places_with_geom]
+    total_area = sum(areas)
+    largest_area = max(areas, default=0.0)
+    largest_city = places_with_geom[areas.index(largest_area)] if largest_area else None
 
     print("\nSpatial Analysis:")
     print(f"  Total area covered: {total_area:.1f} sq km")
@@ -63,26 +74,8 @@ async def spatial_example():
         print(f"  Largest city: {largest_city.name} ({largest_area:.1f} sq km)")
 
     # 4. Search by proximity (places near a point)
-    print("\nSearching places near San Francisco center...")
-    sf_center_lat, sf_center_lon = 37.7749, -122.4194
-
-    # Create a small bounding box around the point
-    proximity_bbox = BBox(
-        min_lat=sf_center_lat - 0.1,
-        max_lat=sf_center_lat + 0.1,
-        min_lon=sf_center_lon - 0.1,
-        max_lon=sf_center_lon + 0.1,
-    )
-
-    nearby_cursor = await connector.search(
-        WOFSearchFilters(
-            placetype="neighbourhood", bbox=proximity_bbox, is_current=True, limit=5
-        )
-    )
-
-    print(f"Found {len(nearby_cursor.places)} neighborhoods near SF center:")
-    for place in nearby_cursor.places:
-        print(f"  - {place.name}")
+    print(f"\nFound {len(nearby_cursor.places)} neighborhoods near SF center:")
+    sys.stdout.write("".join(f"  - {place.name}\n" for place in nearby_cursor.places))
 
     await connector.disconnect()
     print("\n✓ Spatial queries complete!")
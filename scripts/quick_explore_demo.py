@@ -31,13 +31,26 @@ async def main() -> None:
     outdir = Path("wof-explorer/output")
     outdir.mkdir(parents=True, exist_ok=True)
 
+    # Each file is encoded and written independently, so run them in
+    # worker threads rather than one after another
+    paths = {key: outdir / f"{key}.geojson" for key in selections}
+    await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                collection.write_geojson,
+                paths[key],
+                indent=2,
+                use_polygons=True,
+                require_geometry=False,
+                # County polygons dominate the output size; quantize their vertices
+                quantize=key == "us_counties",
+            )
+            for key, collection in selections.items()
+        ]
+    )
+
     for key, collection in selections.items():
-        path = outdir / f"{key}.geojson"
-        geojson = collection.to_geojson_string(
-            indent=2, use_polygons=True, require_geometry=False
-        )
-        path.write_text(geojson, encoding="utf-8")
-        print(f"Wrote {key}: {path} ({len(collection)} features)")
+        print(f"Wrote {key}: {paths[key]} ({len(collection)} features)")
 
     await connector.disconnect()
 
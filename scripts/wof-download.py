@@ -1,11 +1,12 @@
-#!/usr/bin/env -S uv run --with httpx --with typer --with rich --with prompt-toolkit --python 3.13
+#!/usr/bin/env -S uv run --with aiohttp --with typer --with rich --with prompt-toolkit --with indexed-bzip2 --python 3.13
 # /// script
 # requires-python = ">=3.13"
 # dependencies = [
-#     "httpx",
+#     "aiohttp",
 #     "typer",
 #     "rich",
 #     "prompt-toolkit",
+#     "indexed-bzip2",
 # ]
 # ///
 
@@ -33,14 +34,22 @@ databases into a single file for easier access.
 """
 
 import asyncio
+import bisect
 import bz2
+import json
+import mmap
+import os
+import shutil
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Set
-from dataclasses import dataclass
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import List, NamedTuple, Optional, Dict, Set, Tuple
+from dataclasses import dataclass, field
 
-import httpx
+import aiohttp
 import typer
 from rich.console import Console
 from rich.progress import (
@@ -49,17 +58,28 @@ from rich.progress import (
     TextColumn,
     BarColumn,
     DownloadColumn,
+    MofNCompleteColumn,
+    TimeElapsedColumn,
     TransferSpeedColumn,
     TimeRemainingColumn,
     TaskID,
 )
 from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich.box import ROUNDED
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
+# Native parallel bz2 decoder; without it extraction uses the bz2 module
+try:
+    import indexed_bzip2
+
+    INDEXED_BZIP2_AVAILABLE = True
+except ImportError:
+    INDEXED_BZIP2_AVAILABLE = False
+
 
 # Initialize Typer app and Rich console
 app = typer.Typer(help="Download WhosOnFirst SQLite database files")
@@ -323,6 +343,9 @@ COUNTRY_CODES = [
     "zw",
 ]
 
+# Membership checks against the codes; COUNTRY_CODES keeps display order
+COUNTRY_CODE_SET = frozenset(COUNTRY_CODES)
+
 COUNTRY_NAMES = [
     "Andorra",
     "United Arab Emirates (الإمارات العربيّة المتّحدة)",
@@ -580,42 +603,103 @@ COUNTRY_NAMES = [
 ]
 
 
-@dataclass(frozen=True)
+# Status cell for selected countries, styled once rather than parsed per row
+SELECTED_MARK = Text("✓", style="bold bright_green")
+
+# Longest query-word prefix looked up in CountryManager's substring index
+SEARCH_INDEX_DEPTH = 4
+
+
+@dataclass(frozen=True, slots=True)
 class Country:
     """Represents a country with its code and name."""
 
     code: str
     name: str
-
-    @property
-    def display_name(self) -> str:
-        """Return a formatted display name."""
-        # Extract just the primary name (before parentheses)
-        primary_name = self.name.split("(")[0].strip()
-        return f"{primary_name} ({self.code.upper()})"
-
-    @property
-    def search_text(self) -> str:
-        """Return searchable text (lowercase for matching)."""
-        return f"{self.code} {self.name}".lower()
+    # Derived strings, computed once since search and display hit them often
+    primary_name: str = field(init=False, repr=False, compare=False)
+    display_name: str = field(init=False, repr=False, compare=False)
+    search_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Primary name (before any localized names in parentheses)
+        primary_name = self.name.split("(", 1)[0].strip()
+        object.__setattr__(self, "primary_name", primary_name)
+        # Formatted display name
+        object.__setattr__(
+            self, "display_name", f"{primary_name} ({self.code.upper()})"
+        )
+        # Searchable text (lowercase for matching)
+        object.__setattr__(self, "search_text", f"{self.code} {self.name}".lower())
 
 
 class CountryManager:
     """Manages country data and search functionality."""
 
-    def __init__(self):
-        self.countries = [
-            Country(code, name) for code, name in zip(COUNTRY_CODES, COUNTRY_NAMES)
+    # Everything is built on first use, so commands that never look up a
+    # country (--combine-only, --list) skip the lookup tables
+
+    @cached_property
+    def countries(self) -> List[Country]:
+        """All downloadable countries, in code order."""
+        return [Country(code, name) for code, name in zip(COUNTRY_CODES, COUNTRY_NAMES)]
+
+    @cached_property
+    def code_map(self) -> Dict[str, Country]:
+        """Countries keyed by lowercase code."""
+        return {c.code.lower(): c for c in self.countries}
+
+    @cached_property
+    def name_map(self) -> Dict[str, Country]:
+        """Countries keyed by lowercase full name."""
+        return {c.name.lower(): c for c in self.countries}
+
+    @cached_property
+    def _search_texts(self) -> List[str]:
+        # Lowercased text per country, computed once rather than per search
+        return [c.search_text for c in self.countries]
+
+    @cached_property
+    def _names_lower(self) -> List[str]:
+        return [c.name.lower() for c in self.countries]
+
+    @cached_property
+    def _records(self) -> List[Tuple[Country, str, str, float]]:
+        # What the scoring loop reads per candidate, unpacked in one step
+        return [
+            (country, search_text, name_lower, len(country.name) * 0.1)
+            for country, search_text, name_lower in zip(
+                self.countries, self._search_texts, self._names_lower
+            )
         ]
-        self.code_map = {c.code.lower(): c for c in self.countries}
-        self.name_map = {c.name.lower(): c for c in self.countries}
+
+    @cached_property
+    def _substring_index(self) -> Dict[str, Set[int]]:
+        # Every substring up to SEARCH_INDEX_DEPTH chars -> country indices,
+        # so search only scores countries that can contain each query word
+        index_map: Dict[str, Set[int]] = defaultdict(set)
+        for index, text in enumerate(self._search_texts):
+            for length in range(1, SEARCH_INDEX_DEPTH + 1):
+                for start in range(len(text) - length + 1):
+                    index_map[text[start : start + length]].add(index)
+        return index_map
+
+    def _candidates(self, words: List[str]) -> List[int]:
+        """Indices of countries whose search text may contain every word."""
+        candidates: Optional[Set[int]] = None
+        for word in words:
+            matches = self._substring_index.get(word[:SEARCH_INDEX_DEPTH], set())
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+        return sorted(candidates)
 
     def search(self, query: str) -> List[Country]:
         """Search for countries by code or name with multi-word support."""
         query = query.lower().strip()
 
         # Exact code match
-        if query in self.code_map:
+        if query in COUNTRY_CODE_SET:
             return [self.code_map[query]]
 
         # Split query into words for multi-word search
@@ -623,72 +707,88 @@ class CountryManager:
         if not words:
             return []
 
+        first, rest = words[0], words[1:]
+        # Only one country can match the whole query by name
+        exact = self.name_map.get(query)
+        records = self._records
         scored_results = []
 
-        for country in self.countries:
-            search_text = country.search_text
-            name_lower = country.name.lower()
-
-            # Check if all words match
-            match = True
-            score = 0
-            last_pos = 0
+        for index in self._candidates(words):
+            country, search_text, name_lower, length_penalty = records[index]
+
+            # First word matching at beginning of name gets highest score,
+            # then at the beginning of any word in the name
+            pos = search_text.find(first)
+            if pos == -1:
+                continue
+            if name_lower.startswith(first):
+                score = 1000
+            elif pos > 0 and search_text[pos - 1] == " ":
+                score = 500
+            else:
+                score = 100
+            last_pos = pos + len(first)
 
-            for i, word in enumerate(words):
-                # Find word starting from last position
+            # Subsequent words must match in order
+            for word in rest:
                 pos = search_text.find(word, last_pos)
                 if pos == -1:
-                    match = False
                     break
-
-                # Score based on position and word index
-                if i == 0:
-                    # First word matching at beginning of name gets highest score
-                    if name_lower.startswith(word):
-                        score += 1000
-                    # First word matching at beginning of any word in name
-                    elif pos > 0 and search_text[pos - 1] == " ":
-                        score += 500
-                    else:
-                        score += 100
-                else:
-                    # Subsequent words matching in order
-                    if pos > last_pos:
-                        score += 50
-                    # Bonus for words at word boundaries
-                    if pos > 0 and search_text[pos - 1] == " ":
-                        score += 25
-
+                if pos > last_pos:
+                    score += 50
+                # Bonus for words at word boundaries
+                if pos > 0 and search_text[pos - 1] == " ":
+                    score += 25
                 last_pos = pos + len(word)
-
-            if match:
+            else:
                 # Bonus for exact name match (ignoring case)
-                if query == name_lower or query == country.code.lower():
+                if country is exact:
                     score += 10000
                 # Bonus for shorter names (more specific matches)
-                score -= len(country.name) * 0.1
-                scored_results.append((score, country))
+                scored_results.append((score - length_penalty, country))
 
         # Sort by score (highest first) and return countries
         scored_results.sort(key=lambda x: x[0], reverse=True)
         return [country for score, country in scored_results]
 
+    def prefix_search(self, query: str) -> List[Country]:
+        """Search with the longest prefix of query that matches anything."""
+        # Matches only shrink as the query grows, so binary search the
+        # prefix length instead of retrying every shorter prefix
+        query = query.lower().strip()
+        low, high, matches = 0, len(query), []
+        while low < high:
+            mid = (low + high + 1) // 2
+            results = self.search(query[:mid])
+            if results:
+                low, matches = mid, results
+            else:
+                high = mid - 1
+        return matches
+
+    def suggestions(self, text: str, limit: int = 5) -> List[Country]:
+        """Countries whose search text contains the first letters of text."""
+        # Three letters fit within SEARCH_INDEX_DEPTH, so the index entry
+        # already is the exact match set, in code order
+        prefix = text[:3].lower()
+        return [self.countries[index] for index in self._candidates([prefix])[:limit]]
+
     def get_by_input(self, input_str: str) -> Optional[Country]:
         """Get a country by code or name input."""
         input_lower = input_str.lower().strip()
 
         # Try exact code match first
-        if input_lower in self.code_map:
+        if input_lower in COUNTRY_CODE_SET:
             return self.code_map[input_lower]
 
         # Try exact name match
         if input_lower in self.name_map:
             return self.name_map[input_lower]
 
-        # Try partial name match
-        for country in self.countries:
-            if input_lower in country.name.lower():
-                return country
+        # Try partial name match, checking only indexed candidates
+        for index in self._candidates([input_lower]):
+            if input_lower in self._names_lower[index]:
+                return self.countries[index]
 
         return None
 
@@ -720,13 +820,195 @@ class CountryManager:
         return countries
 
 
+@lru_cache(maxsize=1)
+def get_country_manager() -> CountryManager:
+    """Shared CountryManager, so its lookup tables are built at most once."""
+    return CountryManager()
+
+
+# Network read size and how much to buffer before each write
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 8 << 20
+
+# Seconds between progress bar updates for a download
+PROGRESS_INTERVAL = 0.1
+
+# Archives larger than this are fetched as parallel byte ranges
+RANGED_DOWNLOAD_THRESHOLD = 32 << 20
+
+# Copy buffer for streaming bz2 extraction (a few 900 KiB bz2 blocks)
+EXTRACT_BUFFER_SIZE = 4 << 20
+
+# Memory-map limit while merging; SQLite clamps it to the file size and its
+# compile-time maximum, and reads mapped pages instead of issuing pread()
+MERGE_MMAP_SIZE = 32 << 30
+
+# Connection settings while merging databases, and the defaults restored after
+COMBINE_PRAGMAS = (
+    f"mmap_size={MERGE_MMAP_SIZE}",
+    "journal_mode=MEMORY",
+    "synchronous=OFF",
+    "temp_store=MEMORY",
+    "cache_size=-262144",
+    # ANALYZE samples each index instead of scanning it in full
+    "analysis_limit=1000",
+)
+RESTORE_PRAGMAS = ("journal_mode=DELETE", "synchronous=FULL")
+# A moved base is the user's only copy of that country, so merging into it
+# keeps the rollback journal and syncs every committed source
+MOVE_PRAGMAS = tuple(
+    pragma
+    for pragma in COMBINE_PRAGMAS
+    if not pragma.startswith(("journal_mode", "synchronous"))
+) + ("journal_mode=DELETE", "synchronous=NORMAL")
+
+# Pages copied per step when cloning the base database with the backup API
+BACKUP_STEP_PAGES = 10000
+
+# bzip2 block and end-of-stream markers (48-bit, not byte aligned)
+BZ2_BLOCK_MAGIC = 0x314159265359
+BZ2_EOS_MAGIC = 0x177245385090
+BZ2_MAGIC_MASK = (1 << 48) - 1
+
+
+def _writev_all(fd: int, buffers: List[bytes]):
+    """Write all buffers to fd, finishing any short writev with plain writes."""
+    written = os.writev(fd, buffers)
+    total = sum(len(b) for b in buffers)
+    if written < total:
+        remaining = memoryview(b"".join(buffers))[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining) :]
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int):
+    """Write all of data to fd at offset, finishing any short pwrite."""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+async def _to_thread_uncancelled(func, *args):
+    """
+    Run func in a worker thread. If the caller is cancelled, wait for the
+    thread to finish before re-raising, so the file descriptor it writes to
+    is not closed (and its number reused) while it is still running.
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+def _find_bz2_markers(data, pattern: int) -> List[int]:
+    """Return the bit offsets of every occurrence of a 48-bit bzip2 marker."""
+    offsets = []
+    for shift in range(8):
+        # Bytes of the marker that are fully determined at this bit shift
+        window = (pattern << (8 - shift)).to_bytes(7, "big")
+        needle = window[1:6] if shift else window[:6]
+        lead = 1 if shift else 0
+
+        pos = data.find(needle)
+        while pos != -1:
+            start = pos - lead
+            if start >= 0:
+                candidate = int.from_bytes(
+                    data[start : start + 7].ljust(7, b"\0"), "big"
+                )
+                if (candidate >> (8 - shift)) & BZ2_MAGIC_MASK == pattern:
+                    offsets.append(start * 8 + shift)
+            pos = data.find(needle, pos + 1)
+    return sorted(offsets)
+
+
+def _decode_bz2_block(data, start_bit: int, end_bit: int) -> bytes:
+    """Decode one bzip2 block by wrapping it in a single-block stream."""
+    nbits = end_bit - start_bit
+    raw = int.from_bytes(data[start_bit // 8 : (end_bit + 7) // 8], "big")
+    tail = ((end_bit + 7) // 8) * 8 - end_bit
+    block = (raw >> tail) & ((1 << nbits) - 1)
+
+    # A single-block stream's combined CRC is the block CRC itself
+    block_crc = (block >> (nbits - 80)) & 0xFFFFFFFF
+    bits = (block << 80) | (BZ2_EOS_MAGIC << 32) | block_crc
+    total = nbits + 80
+    pad = -total % 8
+    stream = b"BZh9" + (bits << pad).to_bytes((total + pad) // 8, "big")
+    return bz2.decompress(stream)
+
+
+class BZ2StreamDecoder:
+    """Incremental decoder for bz2 data that may hold several streams."""
+
+    def __init__(self):
+        self._decompressor = bz2.BZ2Decompressor()
+        self._in_stream = False
+
+    def decompress(self, data: bytes) -> List[bytes]:
+        """Decode the next piece of compressed data, returning output chunks."""
+        output = []
+        while data:
+            self._in_stream = True
+            output.append(self._decompressor.decompress(data))
+            if not self._decompressor.eof:
+                break
+            # Stream finished; anything left over starts the next one
+            data = self._decompressor.unused_data
+            self._decompressor = bz2.BZ2Decompressor()
+            self._in_stream = False
+        return output
+
+    @property
+    def complete(self) -> bool:
+        """True when no stream has been left partially decoded."""
+        return not self._in_stream
+
+
+class ArchiveProbe(NamedTuple):
+    """What a HEAD request reports about a remote archive."""
+
+    size: int
+    validator: str
+    accepts_ranges: bool
+
+
+class ProgressThrottle:
+    """Collects progress for one task and hands it to Rich a few times a second."""
+
+    def __init__(self, progress: Progress, task_id: TaskID):
+        self.progress = progress
+        self.task_id = task_id
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def advance(self, amount: int):
+        """Record progress, redrawing only if PROGRESS_INTERVAL has passed."""
+        self._pending += amount
+        now = time.monotonic()
+        if now - self._last_flush >= PROGRESS_INTERVAL:
+            self._last_flush = now
+            self.flush()
+
+    def flush(self):
+        """Hand any recorded progress to Rich."""
+        if self._pending:
+            self.progress.advance(self.task_id, self._pending)
+            self._pending = 0
+
+
 class WOFDownloader:
     """Handles downloading and extraction of WOF database files."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, range_segments: int = 4):
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.base_url = "https://data.geocode.earth/wof/dist/sqlite"
+        self.range_segments = max(1, range_segments)
 
     def get_download_url(self, country_code: str) -> str:
         """Generate the download URL for a country."""
@@ -744,7 +1026,7 @@ class WOFDownloader:
         country: Country,
         progress: Progress,
         task_id: TaskID,
-        client: httpx.AsyncClient,
+        session: aiohttp.ClientSession,
     ) -> bool:
         """Download a single country database."""
         url = self.get_download_url(country.code)
@@ -761,35 +1043,55 @@ class WOFDownloader:
             return True
 
         try:
-            # Download the file
-            progress.update(
-                task_id,
-                description=f"[bold cyan]⬇[/bold cyan]  Downloading {country.display_name}",
-            )
-
-            async with client.stream("GET", url) as response:
-                response.raise_for_status()
-
-                # Get total size if available
-                total_size = int(response.headers.get("content-length", 0))
-                if total_size:
-                    progress.update(task_id, total=total_size)
-
-                # Download to compressed file
-                with open(compressed_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        progress.advance(task_id, len(chunk))
-
-            # Extract the file
-            progress.update(
-                task_id,
-                description=f"[bold yellow]📦[/bold yellow] Extracting {country.display_name}",
-            )
-            await self.extract_bz2(compressed_path, final_path)
-
-            # Clean up compressed file
-            compressed_path.unlink()
+            probe: Optional[ArchiveProbe] = None
+            reuse_archive = False
+            if compressed_path.exists():
+                # Archive left over from an earlier run: reuse it if it is
+                # complete, which skips the network entirely
+                try:
+                    probe = await self._probe(url, session)
+                    reuse_archive = probe.size == compressed_path.stat().st_size
+                except aiohttp.ClientConnectionError:
+                    reuse_archive = True  # Offline: extraction will validate it
+                if not reuse_archive:
+                    compressed_path.unlink()
+
+            if not reuse_archive:
+                progress.update(
+                    task_id,
+                    description=f"[bold cyan]⬇[/bold cyan]  Downloading {country.display_name}",
+                )
+                if probe is None and self.range_segments > 1:
+                    # Ranges only speed things up; if the HEAD fails (e.g. a
+                    # 405), the plain GET below may still work
+                    try:
+                        probe = await self._probe(url, session)
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        probe = None
+
+            if reuse_archive or (probe and self._use_ranges(probe)):
+                if not reuse_archive:
+                    # Large archive: fetch byte ranges in parallel, then
+                    # decode its blocks in parallel from disk
+                    await self._download_ranged(
+                        url,
+                        compressed_path,
+                        probe.size,
+                        probe.validator,
+                        progress,
+                        task_id,
+                        session,
+                    )
+                progress.update(
+                    task_id,
+                    description=f"[bold yellow]📦[/bold yellow] Extracting {country.display_name}",
+                )
+                await self.extract_bz2(compressed_path, final_path)
+                compressed_path.unlink()
+            else:
+                await self._download_and_extract(
+                    url, final_path, progress, task_id, session
+                )
 
             progress.update(
                 task_id,
@@ -797,10 +1099,10 @@ class WOFDownloader:
             )
             return True
 
-        except httpx.HTTPStatusError as e:
+        except aiohttp.ClientResponseError as e:
             progress.update(
                 task_id,
-                description=f"[bold red]❌[/bold red] {country.display_name} [dim](HTTP {e.response.status_code})[/dim]",
+                description=f"[bold red]❌[/bold red] {country.display_name} [dim](HTTP {e.status})[/dim]",
             )
             return False
         except Exception as e:
@@ -810,19 +1112,290 @@ class WOFDownloader:
             )
             return False
 
+    async def _probe(self, url: str, session: aiohttp.ClientSession) -> ArchiveProbe:
+        """HEAD the archive for its size, version and Range support."""
+        async with session.head(
+            url, allow_redirects=True, raise_for_status=True
+        ) as response:
+            return ArchiveProbe(
+                size=response.content_length or 0,
+                # ETag (or Last-Modified date) identifying this version of
+                # the archive, used to decide if a partial download can resume
+                validator=response.headers.get("ETag")
+                or response.headers.get("Last-Modified", ""),
+                accepts_ranges=response.headers.get("Accept-Ranges", "").lower()
+                == "bytes",
+            )
+
+    def _use_ranges(self, probe: ArchiveProbe) -> bool:
+        """Whether an archive is worth fetching as parallel byte ranges."""
+        return (
+            self.range_segments > 1
+            and probe.accepts_ranges
+            and probe.size > RANGED_DOWNLOAD_THRESHOLD
+        )
+
+    def _load_resume_ranges(
+        self, part_path: Path, state_path: Path, size: int, validator: str
+    ) -> Optional[List[List[int]]]:
+        """Remaining byte ranges of an interrupted download of this archive."""
+        if not (part_path.exists() and state_path.exists()):
+            return None
+        try:
+            state = json.loads(state_path.read_text())
+        except (OSError, ValueError):
+            return None
+        # The "latest" archives are republished; never mix two versions
+        if state.get("size") != size or state.get("validator") != validator:
+            return None
+        return [list(byte_range) for byte_range in state["ranges"]]
+
+    async def _download_ranged(
+        self,
+        url: str,
+        compressed_path: Path,
+        size: int,
+        validator: str,
+        progress: Progress,
+        task_id: TaskID,
+        session: aiohttp.ClientSession,
+    ):
+        """
+        Download an archive as parallel Range requests into one file.
+
+        Data lands in a .part file. If the download fails or is interrupted,
+        the byte ranges still missing are saved next to it so the next run
+        fetches only those.
+        """
+        part_path = compressed_path.with_name(compressed_path.name + ".part")
+        state_path = compressed_path.with_name(compressed_path.name + ".part.json")
+
+        ranges = self._load_resume_ranges(part_path, state_path, size, validator)
+        if ranges is None:
+            segment = -(-size // self.range_segments)
+            ranges = [
+                [start, min(start + segment, size) - 1]
+                for start in range(0, size, segment)
+            ]
+            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            # Reserve the whole file so each segment writes at its own offset
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+        else:
+            fd = os.open(part_path, os.O_WRONLY)
+
+        remaining = sum(end - start + 1 for start, end in ranges)
+        progress.update(task_id, total=size, completed=size - remaining)
+        throttle = ProgressThrottle(progress, task_id)
+
+        async def fetch(byte_range: List[int]):
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator and not validator.startswith("W/"):
+                # Only accept the range if the archive hasn't changed
+                headers["If-Range"] = validator
+            async with session.get(
+                url, headers=headers, raise_for_status=True
+            ) as response:
+                if response.status != 206:
+                    raise RuntimeError("Server ignored the Range request")
+                # Write once per WRITE_BATCH_SIZE bytes, in a thread so the
+                # other segments and downloads keep flowing
+                buffers: List[bytes] = []
+                pending = 0
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    buffers.append(chunk)
+                    pending += len(chunk)
+                    throttle.advance(len(chunk))
+                    if pending >= WRITE_BATCH_SIZE:
+                        await _to_thread_uncancelled(
+                            _pwrite_all, fd, b"".join(buffers), byte_range[0]
+                        )
+                        # Advanced only once on disk, so a resume refetches
+                        # anything that never got written
+                        byte_range[0] += pending
+                        buffers.clear()
+                        pending = 0
+                if buffers:
+                    await _to_thread_uncancelled(
+                        _pwrite_all, fd, b"".join(buffers), byte_range[0]
+                    )
+                    byte_range[0] += pending
+            if byte_range[0] != end + 1:
+                raise EOFError(f"Range {start}-{end} ended early")
+
+        try:
+            # A TaskGroup cancels the other segments as soon as one fails
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for byte_range in ranges:
+                        if byte_range[0] <= byte_range[1]:
+                            tg.create_task(fetch(byte_range))
+            # The script runs on 3.13 (see the header); ruff checks it
+            # against the package's 3.9 floor
+            except ExceptionGroup as group:  # noqa: F821
+                # Surface the first failure (e.g. an HTTP error) as-is
+                raise group.exceptions[0] from None
+        except BaseException:
+            # Keep what arrived and record what's missing for the next run
+            os.close(fd)
+            state_path.write_text(
+                json.dumps({"size": size, "validator": validator, "ranges": ranges})
+            )
+            raise
+        finally:
+            throttle.flush()
+        os.close(fd)
+
+        state_path.unlink(missing_ok=True)
+        os.replace(part_path, compressed_path)
+
+    async def _download_and_extract(
+        self,
+        url: str,
+        final_path: Path,
+        progress: Progress,
+        task_id: TaskID,
+        session: aiohttp.ClientSession,
+    ):
+        """
+        Stream an archive through a bz2 decoder straight into the database.
+
+        Compressed bytes never touch disk. Output goes to a temporary file
+        that replaces final_path only once the whole stream has decoded.
+        """
+        partial_path = final_path.with_name(final_path.name + ".tmp")
+        decoder = BZ2StreamDecoder()
+
+        try:
+            async with session.get(url, raise_for_status=True) as response:
+                # Get total size if available
+                total_size = response.content_length or 0
+                if total_size:
+                    progress.update(task_id, total=total_size)
+                throttle = ProgressThrottle(progress, task_id)
+
+                # Decode and write once per WRITE_BATCH_SIZE compressed bytes.
+                # Both run in one thread call, since the decoded output is
+                # several times larger, so other downloads keep flowing
+                fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+
+                def decode_and_write(data: bytes):
+                    _writev_all(fd, decoder.decompress(data))
+
+                try:
+                    buffers: List[bytes] = []
+                    pending = 0
+                    async for chunk in response.content.iter_chunked(
+                        DOWNLOAD_CHUNK_SIZE
+                    ):
+                        buffers.append(chunk)
+                        pending += len(chunk)
+                        throttle.advance(len(chunk))
+                        if pending >= WRITE_BATCH_SIZE or len(buffers) >= 64:
+                            await _to_thread_uncancelled(
+                                decode_and_write, b"".join(buffers)
+                            )
+                            buffers.clear()
+                            pending = 0
+                    if buffers:
+                        await _to_thread_uncancelled(
+                            decode_and_write, b"".join(buffers)
+                        )
+                finally:
+                    os.close(fd)
+                    throttle.flush()
+
+            if not decoder.complete:
+                raise EOFError("Download ended partway through a bz2 stream")
+            os.replace(partial_path, final_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
     async def extract_bz2(self, compressed_path: Path, output_path: Path):
-        """Extract a bz2 compressed file."""
+        """
+        Extract a bz2 compressed file.
+
+        Output goes to a temporary file that replaces output_path only once
+        the archive has fully decoded, so a truncated archive never leaves a
+        database that the next run would skip as already downloaded.
+        """
+        partial_path = output_path.with_name(output_path.name + ".tmp")
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None, self._extract_bz2_sync, compressed_path, output_path
-        )
+        try:
+            await loop.run_in_executor(
+                None, self._extract_bz2_parallel, compressed_path, partial_path
+            )
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+    def _extract_bz2_parallel(self, compressed_path: Path, output_path: Path):
+        """
+        Block-parallel bz2 extraction (pbzip2-style).
+
+        Every bzip2 block decodes independently, so the blocks are located
+        by their bit-level magic and decoded across a thread pool (the bz2
+        module releases the GIL while decompressing). Falls back to the
+        streaming path for single-block files or if any block fails to decode.
+        Uses indexed_bzip2's native decoder instead when it is installed.
+        """
+        if INDEXED_BZIP2_AVAILABLE:
+            with (
+                indexed_bzip2.open(
+                    str(compressed_path), parallelization=os.cpu_count() or 1
+                ) as f_in,
+                open(output_path, "wb", buffering=0) as f_out,
+            ):
+                shutil.copyfileobj(f_in, f_out, length=EXTRACT_BUFFER_SIZE)
+            return
+
+        with open(compressed_path, "rb") as f_in:
+            if os.fstat(f_in.fileno()).st_size == 0:
+                return self._extract_bz2_sync(compressed_path, output_path)
+            with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                starts = _find_bz2_markers(data, BZ2_BLOCK_MAGIC)
+                if len(starts) < 2:
+                    return self._extract_bz2_sync(compressed_path, output_path)
+
+                # A block runs until the next block or end-of-stream marker
+                boundaries = sorted(starts + _find_bz2_markers(data, BZ2_EOS_MAGIC))
+                next_boundary = dict(zip(boundaries, boundaries[1:]))
+                if any(start not in next_boundary for start in starts):
+                    return self._extract_bz2_sync(compressed_path, output_path)
+
+                workers = os.cpu_count() or 1
+                try:
+                    with (
+                        ThreadPoolExecutor(max_workers=workers) as pool,
+                        open(output_path, "wb") as f_out,
+                    ):
+                        # Keep a bounded window of blocks in flight, written in order
+                        window = workers * 2
+                        for i in range(0, len(starts), window):
+                            batch = starts[i : i + window]
+                            for chunk in pool.map(
+                                lambda start: _decode_bz2_block(
+                                    data, start, next_boundary[start]
+                                ),
+                                batch,
+                            ):
+                                f_out.write(chunk)
+                except (OSError, ValueError, EOFError):
+                    # A marker false positive inside compressed data
+                    return self._extract_bz2_sync(compressed_path, output_path)
 
     def _extract_bz2_sync(self, compressed_path: Path, output_path: Path):
         """Synchronous bz2 extraction."""
-        with bz2.open(compressed_path, "rb") as f_in:
-            with open(output_path, "wb") as f_out:
-                for chunk in iter(lambda: f_in.read(1024 * 1024), b""):
-                    f_out.write(chunk)
+        with (
+            bz2.open(compressed_path, "rb") as f_in,
+            open(output_path, "wb", buffering=0) as f_out,
+        ):
+            shutil.copyfileobj(f_in, f_out, length=EXTRACT_BUFFER_SIZE)
 
     async def download_batch(self, countries: List[Country], max_concurrent: int = 3):
         """Download multiple countries with progress tracking."""
@@ -830,9 +1403,21 @@ class WOFDownloader:
             console.print("[yellow]No countries selected for download.[/yellow]")
             return
 
-        # Create HTTP client with timeout
-        timeout = httpx.Timeout(60.0, connect=10.0)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        # Create HTTP session; no total timeout so large archives can finish,
+        # but stalled reads and slow connects still fail
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=10.0, sock_read=60.0)
+        # Keep connections (and DNS answers) alive across the redirect from
+        # geocode.earth to the CDN so each country skips a fresh TLS setup
+        connections = max_concurrent * self.range_segments
+        connector = aiohttp.TCPConnector(
+            limit=connections * 2,
+            limit_per_host=connections,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+        async with aiohttp.ClientSession(
+            timeout=timeout, connector=connector
+        ) as session:
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -842,26 +1427,31 @@ class WOFDownloader:
                 TimeRemainingColumn(),
                 console=console,
             ) as progress:
-                # Create tasks for each country
-                tasks = []
+                # Queue every country up front; a fixed pool of workers pulls
+                # from it, adding each progress row when its download starts
+                queue: asyncio.Queue[Country] = asyncio.Queue()
                 for country in countries:
-                    task_id = progress.add_task(
-                        f"[cyan]⏳[/cyan] {country.display_name}", total=100
-                    )
-                    tasks.append(
-                        self.download_country(country, progress, task_id, client)
-                    )
-
-                # Run downloads with limited concurrency
-                semaphore = asyncio.Semaphore(max_concurrent)
-
-                async def limited_download(task):
-                    async with semaphore:
-                        return await task
+                    queue.put_nowait(country)
+                results: List[bool] = []
+
+                async def worker():
+                    while True:
+                        try:
+                            country = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        task_id = progress.add_task(
+                            f"[cyan]⏳[/cyan] {country.display_name}", total=100
+                        )
+                        results.append(
+                            await self.download_country(
+                                country, progress, task_id, session
+                            )
+                        )
 
-                results = await asyncio.gather(
-                    *[limited_download(task) for task in tasks]
-                )
+                async with asyncio.TaskGroup() as tg:
+                    for _ in range(min(max_concurrent, len(countries))):
+                        tg.create_task(worker())
 
                 # Summary
                 successful = sum(1 for r in results if r)
@@ -887,11 +1477,14 @@ class CountryCompleter(Completer):
 
     def __init__(self, country_manager: CountryManager):
         self.country_manager = country_manager
+        # Typing and backspacing repeats queries, so keep recent results
+        self._search = lru_cache(maxsize=256)(country_manager.search)
 
     def get_completions(self, document: Document, complete_event):
         """Get completions based on current input."""
-        # Get the full text, not just before cursor
-        text = document.text.lower().strip()
+        # Complete only the entry being typed (after the last comma)
+        entry = document.text_before_cursor.rsplit(",", 1)[-1].lstrip()
+        text = entry.lower().strip()
 
         # Don't complete commands but allow empty string for initial suggestions
         if text in ["list", "selected", "clear", "done", "quit"]:
@@ -902,22 +1495,17 @@ class CountryCompleter(Completer):
             # Show some common countries when no text is entered
             common_countries = ["us", "ca", "gb", "au", "de", "fr", "jp", "cn"]
             matches = [
-                self.country_manager.code_map.get(code)
+                self.country_manager.code_map[code]
                 for code in common_countries
-                if code in self.country_manager.code_map
+                if code in COUNTRY_CODE_SET
             ]
         else:
             # Always search based on current text
-            matches = self.country_manager.search(text)
+            matches = self._search(text)
 
-            # If no matches, try searching with just the first word or partial text
-            if not matches and len(text) > 0:
-                # Try with progressively shorter strings
-                for i in range(len(text), 0, -1):
-                    partial = text[:i]
-                    matches = self.country_manager.search(partial)
-                    if matches:
-                        break
+            # If no matches, fall back to the longest prefix that has some
+            if not matches:
+                matches = self.country_manager.prefix_search(text)
 
         # Always yield completions if we have matches
         if matches:
@@ -925,11 +1513,11 @@ class CountryCompleter(Completer):
                 # Display with country name and code
                 display = country.display_name
 
-                # The completion text should be the full country name
-                # Replace the entire current text
+                # The completion text should be the full country name,
+                # replacing just the current entry
                 yield Completion(
-                    country.name.split("(")[0].strip(),
-                    start_position=-len(document.text),
+                    country.primary_name,
+                    start_position=-len(entry),
                     display=display,
                     display_meta=f"({country.code.upper()})",
                 )
@@ -940,7 +1528,10 @@ class InteractiveSelector:
 
     def __init__(self, country_manager: CountryManager):
         self.country_manager = country_manager
-        self.selected_countries: Set[Country] = set()
+        # Selected country codes, resolved to Country objects on the way out
+        self.selected_countries: Set[str] = set()
+        # The same selection kept in name order for show_selected
+        self.selected_by_name: List[Country] = []
 
     def run(self) -> List[Country]:
         """Run the interactive selector."""
@@ -1007,10 +1598,24 @@ class InteractiveSelector:
 
                 elif user_input.lower() == "clear":
                     self.selected_countries.clear()
+                    self.selected_by_name.clear()
                     console.print(
                         "[bold bright_green]🗑️  Selection cleared![/bold bright_green]"
                     )
 
+                elif "," in user_input:
+                    # Several entries at once: add each one that resolves
+                    for country in self.country_manager.parse_country_list(user_input):
+                        if country.code in self.selected_countries:
+                            console.print(
+                                f"[bold yellow]⚠️  {country.display_name} is already selected[/bold yellow]"
+                            )
+                        else:
+                            self._select(country)
+                            console.print(
+                                f"[bold bright_green]✅ Added {country.display_name}[/bold bright_green]"
+                            )
+
                 else:
                     # Search for countries
                     search_results = self.country_manager.search(user_input)
@@ -1020,12 +1625,12 @@ class InteractiveSelector:
                         if len(search_results) == 1:
                             # Single match - add directly
                             country = search_results[0]
-                            if country in self.selected_countries:
+                            if country.code in self.selected_countries:
                                 console.print(
                                     f"[bold yellow]⚠️  {country.display_name} is already selected[/bold yellow]"
                                 )
                             else:
-                                self.selected_countries.add(country)
+                                self._select(country)
                                 console.print(
                                     f"[bold bright_green]✅ Added {country.display_name}[/bold bright_green]"
                                 )
@@ -1034,14 +1639,23 @@ class InteractiveSelector:
                             console.print(
                                 f"\n[bold bright_blue]🔍 Found {len(search_results)} matches:[/bold bright_blue]"
                             )
+                            # Rows are assembled from styled parts, so Rich
+                            # skips its markup parser for every match
                             for i, country in enumerate(search_results, 1):
                                 marker = (
-                                    "[bold bright_green]✓[/bold bright_green]"
-                                    if country in self.selected_countries
+                                    SELECTED_MARK
+                                    if country.code in self.selected_countries
                                     else " "
                                 )
                                 console.print(
-                                    f"  {marker} [bold white]{i}.[/bold white] [cyan]{country.display_name}[/cyan]"
+                                    Text.assemble(
+                                        "  ",
+                                        marker,
+                                        " ",
+                                        (f"{i}.", "bold white"),
+                                        " ",
+                                        (country.display_name, "cyan"),
+                                    )
                                 )
 
                             console.print(
@@ -1067,12 +1681,12 @@ class InteractiveSelector:
                             else:
                                 continue
 
-                            if country in self.selected_countries:
+                            if country.code in self.selected_countries:
                                 console.print(
                                     f"[bold yellow]⚠️  {country.display_name} is already selected[/bold yellow]"
                                 )
                             else:
-                                self.selected_countries.add(country)
+                                self._select(country)
                                 console.print(
                                     f"[bold bright_green]✅ Added {country.display_name}[/bold bright_green]"
                                 )
@@ -1083,11 +1697,15 @@ class InteractiveSelector:
                             )
                             for i, country in enumerate(search_results[:10], 1):
                                 marker = (
-                                    "[green]✓[/green]"
-                                    if country in self.selected_countries
+                                    ("✓", "green")
+                                    if country.code in self.selected_countries
                                     else " "
                                 )
-                                console.print(f"  {marker} {i}. {country.display_name}")
+                                console.print(
+                                    Text.assemble(
+                                        "  ", marker, f" {i}. {country.display_name}"
+                                    )
+                                )
 
                             if len(search_results) > 10:
                                 console.print(
@@ -1107,12 +1725,12 @@ class InteractiveSelector:
                                 idx = int(selection) - 1
                                 if 0 <= idx < min(10, len(search_results)):
                                     country = search_results[idx]
-                                    if country in self.selected_countries:
+                                    if country.code in self.selected_countries:
                                         console.print(
                                             f"[yellow]{country.display_name} already selected[/yellow]"
                                         )
                                     else:
-                                        self.selected_countries.add(country)
+                                        self._select(country)
                                         console.print(
                                             f"[green]Added {country.display_name}[/green]"
                                         )
@@ -1124,13 +1742,9 @@ class InteractiveSelector:
 
                         # Get first few characters and search
                         if len(user_input) >= 2:
-                            prefix = user_input[:3]
-                            partial_matches = []
-                            for country in self.country_manager.countries:
-                                if prefix.lower() in country.search_text:
-                                    partial_matches.append(country)
-                                    if len(partial_matches) >= 5:
-                                        break
+                            partial_matches = self.country_manager.suggestions(
+                                user_input
+                            )
 
                             if partial_matches:
                                 console.print(
@@ -1149,7 +1763,17 @@ class InteractiveSelector:
             except EOFError:
                 break
 
-        return list(self.selected_countries)
+        return self._selected()
+
+    def _select(self, country: Country):
+        """Add a country to the selection, keeping the name order."""
+        self.selected_countries.add(country.code)
+        bisect.insort(self.selected_by_name, country, key=lambda c: c.name)
+
+    def _selected(self) -> List[Country]:
+        """Resolve the selected codes to countries, in code order."""
+        code_map = self.country_manager.code_map
+        return [code_map[code] for code in sorted(self.selected_countries)]
 
     def show_all_countries(self):
         """Display all available countries in a table."""
@@ -1167,14 +1791,8 @@ class InteractiveSelector:
         table.add_column("Status", justify="center", width=8)
 
         for country in self.country_manager.countries:
-            status = (
-                "[bold bright_green]✓[/bold bright_green]"
-                if country in self.selected_countries
-                else ""
-            )
-            table.add_row(
-                country.code.upper(), country.name.split("(")[0].strip(), status
-            )
+            status = SELECTED_MARK if country.code in self.selected_countries else ""
+            table.add_row(country.code.upper(), country.primary_name, status)
 
         console.print(table)
 
@@ -1196,12 +1814,8 @@ class InteractiveSelector:
         table.add_column("Code", style="bold cyan", width=6)
         table.add_column("Country Name", style="bright_green")
 
-        for i, country in enumerate(
-            sorted(self.selected_countries, key=lambda c: c.name), 1
-        ):
-            table.add_row(
-                str(i), country.code.upper(), country.name.split("(")[0].strip()
-            )
+        for i, country in enumerate(self.selected_by_name, 1):
+            table.add_row(str(i), country.code.upper(), country.primary_name)
 
         console.print(table)
 
@@ -1209,27 +1823,33 @@ class InteractiveSelector:
 class WOFCombiner:
     """Combines multiple WhosOnFirst SQLite databases into a single database."""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, keep_sources: bool = True):
         self.output_dir = output_dir
         self.combined_db_path = output_dir / "whosonfirst-combined.db"
+        # Copy the base database rather than moving it into the combined file
+        self.keep_sources = keep_sources
 
-    def get_database_info(self, db_path: Path) -> Dict:
-        """Get information about a database (size, row counts)."""
+    def get_database_info(self, db_path: Path, size: Optional[int] = None) -> Dict:
+        """Get information about a database (path, size)."""
+        if size is None:
+            size = db_path.stat().st_size
+        return {"path": db_path, "size": size}
+
+    def get_table_counts(self, db_path: Path) -> Dict[str, int]:
+        """Get row counts for each WOF table in a database."""
         conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
 
-        info = {"path": db_path, "size": db_path.stat().st_size, "tables": {}}
-
-        # Get row counts for each table
+        counts = {}
         for table in ["spr", "names", "geojson", "ancestors", "concordances"]:
             try:
                 cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                info["tables"][table] = cursor.fetchone()[0]
+                counts[table] = cursor.fetchone()[0]
             except sqlite3.Error:
-                info["tables"][table] = 0
+                counts[table] = 0
 
         conn.close()
-        return info
+        return counts
 
     def find_wof_databases(self) -> List[Path]:
         """Find all WhosOnFirst databases in the output directory."""
@@ -1242,10 +1862,16 @@ class WOFCombiner:
 
         return databases
 
-    def combine_databases(self, databases: List[Path], progress_callback=None) -> bool:
+    def combine_databases(
+        self,
+        databases: List[Path],
+        progress_callback=None,
+        sizes: Optional[Dict[Path, int]] = None,
+    ) -> bool:
         """
         Combine multiple WhosOnFirst databases into one.
         Uses the largest database as the base to minimize data movement.
+        Sizes already read by the caller can be passed in to skip a stat().
         """
         if not databases:
             console.print("[yellow]No databases found to combine.[/yellow]")
@@ -1255,12 +1881,16 @@ class WOFCombiner:
             console.print(
                 "[yellow]Only one database found. No combining needed.[/yellow]"
             )
-            # Rename the single database to combined
-            databases[0].rename(self.combined_db_path)
+            # Copy or rename the single database to combined
+            if self.keep_sources:
+                shutil.copy2(databases[0], self.combined_db_path)
+            else:
+                databases[0].rename(self.combined_db_path)
             return True
 
-        # Get info for all databases
-        db_infos = [self.get_database_info(db) for db in databases]
+        # Get info for all databases; ranking only needs file sizes
+        sizes = sizes or {}
+        db_infos = [self.get_database_info(db, sizes.get(db)) for db in databases]
 
         # Sort by size (largest first)
         db_infos.sort(key=lambda x: x["size"], reverse=True)
@@ -1272,115 +1902,222 @@ class WOFCombiner:
         console.print("\n[bold cyan]📊 Database Statistics:[/bold cyan]")
         for info in db_infos:
             size_mb = info["size"] / (1024 * 1024)
-            total_rows = sum(info["tables"].values())
-            console.print(
-                f"  • {info['path'].name}: {size_mb:.1f} MB, {total_rows:,} rows"
-            )
+            console.print(f"  • {info['path'].name}: {size_mb:.1f} MB")
 
+        # Row counts are only worth the table scans for the base
+        base_rows = sum(self.get_table_counts(base_db["path"]).values())
         console.print(
-            f"\n[bold green]✓ Using {base_db['path'].name} as base (largest)[/bold green]"
+            f"\n[bold green]✓ Using {base_db['path'].name} as base (largest, {base_rows:,} rows)[/bold green]"
         )
 
-        # Copy base database to combined location
-        console.print("[cyan]📋 Copying base database...[/cyan]")
-        import shutil
-
-        shutil.copy2(base_db["path"], self.combined_db_path)
+        # Moving skips a copy of the largest file, but the merge then writes
+        # into the only copy of that country, so it is opt-in
+        if not self.keep_sources:
+            console.print("[cyan]📋 Moving base database...[/cyan]")
+            os.replace(base_db["path"], self.combined_db_path)
 
         # Connect to the combined database
         conn = sqlite3.connect(str(self.combined_db_path))
-        conn.execute("PRAGMA journal_mode=WAL")  # Better performance for writes
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=10000")
-        conn.execute("PRAGMA temp_store=MEMORY")
+        # Bulk-load settings: a failed copy is deleted anyway, so journaling
+        # and fsyncs can be relaxed; a moved base keeps them
+        for pragma in COMBINE_PRAGMAS if self.keep_sources else MOVE_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
         cursor = conn.cursor()
+        # Secondary indexes dropped for the merge, recreated once at the end
+        dropped_indexes: List[str] = []
+        # Sources committed into the combined database so far
+        merged = 0
 
         try:
-            # Process each additional database
-            for i, db_info in enumerate(other_dbs, 1):
-                db_path = db_info["path"]
-                alias = f"db{i}"
-
-                console.print(f"\n[bold cyan]🔄 Merging {db_path.name}...[/bold cyan]")
-
-                # Attach the database
-                cursor.execute(f"ATTACH DATABASE ? AS {alias}", (str(db_path),))
-
-                # Merge each table
-                tables = ["spr", "names", "geojson", "ancestors", "concordances"]
-
-                for table in tables:
-                    if db_info["tables"].get(table, 0) == 0:
-                        continue
-
-                    start_time = time.time()
-
-                    # Get column names for the table
-                    cursor.execute(f"PRAGMA table_info({table})")
-                    columns = [row[1] for row in cursor.fetchall()]
-                    columns_str = ", ".join(columns)
-
-                    # Use INSERT OR REPLACE to handle potential duplicates
-                    # For most WOF tables, the 'id' field is the primary identifier
-                    query = f"""
-                    INSERT OR REPLACE INTO main.{table} ({columns_str})
-                    SELECT {columns_str} FROM {alias}.{table}
-                    """
+            if self.keep_sources:
+                console.print("[cyan]📋 Copying base database...[/cyan]")
+                self._copy_database(base_db["path"], conn)
+
+                # Appending rows is sequential, but updating every index per
+                # row is random IO; unique indexes stay since OR IGNORE relies
+                # on them. A moved base keeps its indexes, so an interrupted
+                # merge never leaves it without them
+                for name, sql in cursor.execute(
+                    "SELECT name, sql FROM sqlite_master "
+                    "WHERE type = 'index' AND sql IS NOT NULL"
+                ).fetchall():
+                    if not sql.lstrip().upper().startswith("CREATE UNIQUE"):
+                        cursor.execute(f'DROP INDEX "{name}"')
+                        dropped_indexes.append(sql)
+
+            # The WOF schema is fixed, so read each table's columns once
+            tables = ["spr", "names", "geojson", "ancestors", "concordances"]
+            table_columns = {
+                table: ", ".join(
+                    row[1] for row in cursor.execute(f"PRAGMA table_info({table})")
+                )
+                for table in tables
+            }
 
-                    console.print(
-                        f"  → Merging {table}: {db_info['tables'][table]:,} rows...",
-                        end="",
-                    )
-                    cursor.execute(query)
+            # Process each additional database, reporting progress through
+            # one live display instead of a styled line per table
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                source_task = progress.add_task("Databases", total=len(other_dbs))
+                table_task = progress.add_task("Tables", total=len(tables))
+
+                for i, db_info in enumerate(other_dbs, 1):
+                    db_path = db_info["path"]
+                    alias = f"db{i}"
+
+                    progress.update(source_task, description=db_path.name)
+                    progress.update(table_task, completed=0)
+
+                    # Attach the database and merge it in a single transaction
+                    cursor.execute(f"ATTACH DATABASE ? AS {alias}", (str(db_path),))
+                    cursor.execute(f"PRAGMA {alias}.mmap_size={MERGE_MMAP_SIZE}")
+                    cursor.execute("BEGIN")
+
+                    # Merge each table
+                    for table in tables:
+                        progress.update(table_task, description=table)
+
+                        # Skip tables the source lacks or leaves empty
+                        try:
+                            cursor.execute(f"SELECT 1 FROM {alias}.{table} LIMIT 1")
+                            has_rows = cursor.fetchone() is not None
+                        except sqlite3.Error:
+                            has_rows = False
+
+                        if has_rows:
+                            columns_str = table_columns[table]
+
+                            # WOF IDs are globally unique, so a duplicate row is
+                            # identical to the one already merged; OR IGNORE
+                            # skips it instead of a delete+insert that rewrites
+                            # every index entry
+                            cursor.execute(f"""
+                            INSERT OR IGNORE INTO main.{table} ({columns_str})
+                            SELECT {columns_str} FROM {alias}.{table}
+                            """)
+
+                        progress.advance(table_task)
+
+                    # Commit this source, then detach it
                     conn.commit()
+                    merged += 1
+                    cursor.execute(f"DETACH DATABASE {alias}")
+                    progress.advance(source_task)
 
-                    elapsed = time.time() - start_time
-                    console.print(f" [green]✓[/green] ({elapsed:.1f}s)")
-
-                # Detach the database
-                cursor.execute(f"DETACH DATABASE {alias}")
-
-                if progress_callback:
-                    progress_callback(i, len(other_dbs))
+                    if progress_callback:
+                        progress_callback(i, len(other_dbs))
 
             # Optimize the combined database
             console.print("\n[cyan]🔧 Optimizing combined database...[/cyan]")
-            cursor.execute("VACUUM")
+            for sql in dropped_indexes:
+                cursor.execute(sql)
+            # Merges only append pages, so a full VACUUM rewrite buys little
             cursor.execute("ANALYZE")
             conn.commit()
+            for pragma in RESTORE_PRAGMAS:
+                conn.execute(f"PRAGMA {pragma}")
 
             # Get final statistics
             console.print(
                 "\n[bold green]✅ Database combination complete![/bold green]"
             )
 
+            # ANALYZE has just recorded row counts in sqlite_stat1, so read
+            # them instead of scanning every table again. Counts taken from an
+            # index are sampled under analysis_limit and shown as estimates
+            row_counts: Dict[str, int] = {}
+            estimated: Set[str] = set()
+            for table, index, stat in cursor.execute(
+                "SELECT tbl, idx, stat FROM sqlite_stat1"
+            ).fetchall():
+                if index is None:
+                    row_counts[table] = int(stat.split()[0])
+                    estimated.discard(table)
+                elif table not in row_counts:
+                    row_counts[table] = int(stat.split()[0])
+                    estimated.add(table)
+            for table in tables:
+                if table not in row_counts:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    row_counts[table] = cursor.fetchone()[0]
+
+            def rows(table: str) -> str:
+                prefix = "~" if table in estimated else ""
+                return f"{prefix}{row_counts[table]:,}"
+
             # Show final statistics
-            cursor.execute("SELECT COUNT(*) FROM spr")
-            total_places = cursor.fetchone()[0]
 
             final_size = self.combined_db_path.stat().st_size / (1024 * 1024 * 1024)
 
             console.print("\n[bold cyan]📊 Combined Database Statistics:[/bold cyan]")
             console.print(f"  • File: {self.combined_db_path.name}")
             console.print(f"  • Size: {final_size:.2f} GB")
-            console.print(f"  • Total places: {total_places:,}")
+            console.print(f"  • Total places: {rows('spr')}")
 
             for table in tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                console.print(f"  • {table}: {count:,} rows")
+                console.print(f"  • {table}: {rows(table)} rows")
 
             conn.close()
             return True
 
-        except Exception as e:
-            console.print(f"\n[bold red]❌ Error combining databases: {e}[/bold red]")
+        except BaseException as e:
+            # Interrupts are handled too, then re-raised
+            if isinstance(e, Exception):
+                console.print(
+                    f"\n[bold red]❌ Error combining databases: {e}[/bold red]"
+                )
+            else:
+                console.print("\n[bold red]❌ Combining interrupted[/bold red]")
+            conn.rollback()
             conn.close()
-            # Clean up partial combined database on error
-            if self.combined_db_path.exists():
-                self.combined_db_path.unlink()
+            if self.keep_sources:
+                # Clean up partial combined database on error
+                if self.combined_db_path.exists():
+                    self.combined_db_path.unlink()
+            elif not merged:
+                # Nothing was committed, so the base is unchanged
+                os.replace(self.combined_db_path, base_db["path"])
+            else:
+                # Committed sources can't be rolled back; every one of them is
+                # complete, and the originals are untouched
+                console.print(
+                    f"[yellow]{base_db['path'].name} was moved into "
+                    f"{self.combined_db_path.name}, which also holds {merged} "
+                    f"of {len(other_dbs)} other databases. Download it again "
+                    f"before combining.[/yellow]"
+                )
+            if not isinstance(e, Exception):
+                raise
             return False
 
+    def _copy_database(self, source_path: Path, conn: sqlite3.Connection):
+        """Copy a database page by page into an open connection."""
+        source = sqlite3.connect(str(source_path))
+        try:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.percentage:>3.0f}%"),
+                console=console,
+                transient=True,
+            ) as progress:
+                task_id = progress.add_task(source_path.name, total=None)
+                source.backup(
+                    conn,
+                    pages=BACKUP_STEP_PAGES,
+                    progress=lambda status, remaining, total: progress.update(
+                        task_id, completed=total - remaining, total=total
+                    ),
+                )
+        finally:
+            source.close()
+
     async def combine_after_download(self, combine: bool = True):
         """Combine databases after download if requested."""
         if not combine:
@@ -1403,12 +2140,13 @@ class WOFCombiner:
             return
 
         console.print(f"\n[cyan]Found {len(databases)} database(s) to combine:[/cyan]")
-        for db in databases:
-            size_mb = db.stat().st_size / (1024 * 1024)
+        sizes = {db: db.stat().st_size for db in databases}
+        for db, size in sizes.items():
+            size_mb = size / (1024 * 1024)
             console.print(f"  • {db.name} ({size_mb:.1f} MB)")
 
         # Run combination
-        success = self.combine_databases(databases)
+        success = self.combine_databases(databases, sizes=sizes)
 
         if success:
             console.print(
@@ -1446,6 +2184,11 @@ def main(
     max_concurrent: int = typer.Option(
         3, "--max-concurrent", "-m", help="Maximum number of concurrent downloads"
     ),
+    range_segments: int = typer.Option(
+        4,
+        "--range-segments",
+        help="Parallel byte-range requests per large download (1 to disable)",
+    ),
     combine: bool = typer.Option(
         True,
         "--combine/--no-combine",
@@ -1456,6 +2199,13 @@ def main(
         "--combine-only",
         help="Only combine existing databases without downloading",
     ),
+    keep_sources: bool = typer.Option(
+        True,
+        "--keep-sources/--move-sources",
+        help="Copy the largest per-country database into the combined file, or "
+        "move it there to save the copy; a failed move can leave that country "
+        "only in a partial combined file (default: keep)",
+    ),
 ):
     """
     Download WhosOnFirst SQLite database files.
@@ -1463,9 +2213,9 @@ def main(
     If no options are provided, launches interactive mode.
     """
 
-    # Initialize country manager and combiner
-    country_manager = CountryManager()
-    combiner = WOFCombiner(output_dir)
+    # Initialize country manager (lookup tables build lazily) and combiner
+    country_manager = get_country_manager()
+    combiner = WOFCombiner(output_dir, keep_sources=keep_sources)
 
     # Handle combine-only mode
     if combine_only:
@@ -1536,28 +2286,31 @@ def main(
     )
 
     # Create downloader and run
-    downloader = WOFDownloader(output_dir)
+    downloader = WOFDownloader(output_dir, range_segments=range_segments)
 
-    # Run async download
-    asyncio.run(downloader.download_batch(countries_to_download, max_concurrent))
+    async def download_and_combine():
+        await downloader.download_batch(countries_to_download, max_concurrent)
 
-    console.print(
-        Panel(
-            f"[bold bright_green]✨ Downloads complete![/bold bright_green]\n\n"
-            f"[white]📁 Files saved to:[/white] [yellow]{output_dir.absolute()}[/yellow]",
-            title="[bold white]Success[/bold white]",
-            border_style="bright_green",
-        )
-    )
-
-    # Combine databases if requested
-    if combine and len(countries_to_download) > 1:
-        asyncio.run(combiner.combine_after_download(combine=True))
-    elif combine and len(countries_to_download) == 1:
         console.print(
-            "\n[dim]Skipping combination (only one database downloaded)[/dim]"
+            Panel(
+                f"[bold bright_green]✨ Downloads complete![/bold bright_green]\n\n"
+                f"[white]📁 Files saved to:[/white] [yellow]{output_dir.absolute()}[/yellow]",
+                title="[bold white]Success[/bold white]",
+                border_style="bright_green",
+            )
         )
 
+        # Combine databases if requested
+        if combine and len(countries_to_download) > 1:
+            await combiner.combine_after_download(combine=True)
+        elif combine and len(countries_to_download) == 1:
+            console.print(
+                "\n[dim]Skipping combination (only one database downloaded)[/dim]"
+            )
+
+    # Download and combine on one event loop
+    asyncio.run(download_and_combine())
+
 
 if __name__ == "__main__":
     app()
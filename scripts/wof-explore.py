@@ -38,33 +38,32 @@ Usage:
 """
 
 import asyncio
+import importlib.util
 import json
+import os
 import sys
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from textwrap import indent
 from typing import Optional
 
-# Enable nested asyncio for Jupyter compatibility
 import nest_asyncio
-
-nest_asyncio.apply()
-
-# Add parent directory to path for imports
-# Works whether run from wof-explorer/ or geography-patterns/
-wof_explorer_path = Path(__file__).parent.parent
-if wof_explorer_path.name == "wof-explorer":
-    sys.path.insert(0, str(wof_explorer_path))
-else:
-    sys.path.insert(0, str(wof_explorer_path / "wof-explorer"))
-
-# Third-party imports (after sys.path modification)
-import typer  # noqa: E402
-from prompt_toolkit import prompt  # noqa: E402
-from prompt_toolkit.completion import Completer, Completion  # noqa: E402
-from prompt_toolkit.document import Document  # noqa: E402
-from rich.console import Console  # noqa: E402
-from rich.panel import Panel  # noqa: E402
-from rich.table import Table  # noqa: E402
-from rich.tree import Tree  # noqa: E402
+import typer
+from prompt_toolkit import prompt
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.document import Document
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.tree import Tree
+
+# Use the installed wof_explorer package; only fall back to the source tree
+# next to this script when it isn't installed
+if importlib.util.find_spec("wof_explorer") is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 # Import our wof_explorer package - pure implementation
 from wof_explorer import (  # noqa: E402
@@ -75,6 +74,8 @@ from wof_explorer import (  # noqa: E402
     WOFHierarchyCursor,
 )
 
+from wof_explorer.models import WOFCentroid  # noqa: E402
+
 # Import our beautiful display utilities
 from wof_explorer.display import (  # noqa: E402
     print_summary,
@@ -88,13 +89,150 @@ app = typer.Typer(
 )
 console = Console()
 
+# Welcome banner for the interactive explorer, built once
+WELCOME_PANEL = Panel(
+    "[bold cyan]🗺️  WhosOnFirst Interactive Explorer[/bold cyan]\n\n"
+    "[yellow]Quick Start Menu:[/yellow]\n"
+    "  [bold]1[/bold] - Search cities\n"
+    "  [bold]2[/bold] - Search neighborhoods (within city)\n"
+    "  [bold]3[/bold] - Search counties\n"
+    "  [bold]4[/bold] - Browse top cities\n"
+    "  [bold]5[/bold] - Show database stats\n"
+    "  [bold]6[/bold] - Custom search\n"
+    "  [bold green]7[/bold green] - 🎭 Guided Tour (Interactive Demo)\n"
+    "  [bold]q[/bold] - Quit\n\n"
+    "[dim]Or type a command: search, show <id>, stats, export, quit[/dim]",
+    title="Welcome",
+    border_style="cyan",
+)
+
+# Columns shared by the search result tables: (header, Table.add_column kwargs)
+SEARCH_TABLE_COLUMNS = (
+    ("WOF ID", {"style": "dim", "width": 10}),
+    ("Name", {"style": "white", "max_width": 30}),
+    ("Type", {"style": "cyan", "width": 12}),
+    ("Region/State", {"style": "yellow", "width": 15}),
+    ("Status", {"style": "green", "width": 8}),
+)
+
+
+def new_search_table(title: str, index_width: int = 3) -> Table:
+    """Empty search result table with the shared column layout."""
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("#", width=index_width)
+    for header, options in SEARCH_TABLE_COLUMNS:
+        table.add_column(header, **options)
+    return table
+
+
+def add_search_rows(table: Table, places: list):
+    """Add one numbered row per place to a search result table."""
+    for i, place in enumerate(places, 1):
+        name = place.name
+        table.add_row(
+            str(i),
+            str(place.id),
+            # Truncate long names
+            name if len(name) <= 30 else name[:30] + "...",
+            place.placetype,
+            # Region/state if available
+            place.region or place.country or "",
+            "✓" if place.is_current else "ceased",
+        )
+
+
+def summary_cache_path() -> Path:
+    """Database summary cache file, under $XDG_CACHE_HOME when it is set."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "wof-explorer" / "summary.json"
+
+
+async def load_database_summary(connector: WOFConnector, database: Path) -> dict:
+    """explorer.database_summary(), cached on disk by file mtime and size."""
+    database = database.resolve()
+    stat = database.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    cache_path = summary_cache_path()
+
+    # An unreadable or malformed cache is a miss, and gets rewritten
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    entry = cache.get(str(database))
+    if (
+        isinstance(entry, dict)
+        and entry.get("stamp") == stamp
+        and isinstance(entry.get("summary"), dict)
+    ):
+        return entry["summary"]
+
+    # Return the summary as a hit would see it after the JSON round trip, so
+    # both paths agree: non-str keys become strings (a None placetype turns
+    # into "null") and values JSON can't hold go through str()
+    summary = await connector.explorer.database_summary()
+    summary = json.loads(json.dumps(summary, default=str))
+    cache[str(database)] = {"stamp": stamp, "summary": summary}
+
+    # Write a sibling file and swap it in, so a concurrent reader or an
+    # interrupted write never sees half a cache
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path.write_text(json.dumps(cache))
+        os.replace(partial_path, cache_path)
+    except OSError:
+        partial_path.unlink(missing_ok=True)  # Caching is best effort
+    return summary
+
 
 class PlaceCompleter(Completer):
     """Auto-complete for place names."""
 
+    # Results fetched per search, to show variety
+    search_limit = 30
+    # Searches remembered, least recently used evicted first
+    cache_size = 128
+
     def __init__(self, connector: WOFConnector):
         self.connector = connector
-        self._cache = {}
+        self._cache: OrderedDict[str, list] = OrderedDict()
+
+    async def _search(self, text: str) -> list:
+        """Places whose name contains text, reusing earlier searches."""
+        key = text.lower()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Name search is a substring match, so a shorter query that came
+        # back under the limit already holds every match for this one. It
+        # also matches alternate names, which places don't carry, so the
+        # earlier results are only reused when every one of them still
+        # matches on its primary name
+        for end in range(len(key) - 1, 1, -1):
+            cached = self._cache.get(key[:end])
+            if (
+                cached is not None
+                and len(cached) < self.search_limit
+                and all(key in p.name.lower() for p in cached)
+            ):
+                places = cached
+                break
+        else:
+            # A plain str name and int limit need no validation, so skip it
+            results = await self.connector.search(
+                WOFSearchFilters.model_construct(name=text, limit=self.search_limit)
+            )
+            places = results.places
+
+        self._cache[key] = places
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return places
 
     def get_completions(self, document: Document, complete_event):
         """Get place name completions."""
@@ -102,59 +240,43 @@ class PlaceCompleter(Completer):
         if len(text) < 2:
             return
 
-        # Use cached results if available
-        if text in self._cache:
-            results = self._cache[text]
-        else:
-            # Run async search in sync context
-            loop = asyncio.new_event_loop()
-            try:
-                results = loop.run_until_complete(
-                    self.connector.search(
-                        WOFSearchFilters(
-                            name=text,
-                            limit=30,  # Get more results to show variety
-                        )
-                    )
-                )
-                self._cache[text] = results
-            finally:
-                loop.close()
-
-        # Yield completions - prioritize diversity of place types
-        if results and results.places:
-            # Group by placetype to show variety
-            by_type = {}
-            for place in results.places:
-                if place.placetype not in by_type:
-                    by_type[place.placetype] = []
-                by_type[place.placetype].append(place)
-
-            # Show one of each type first, then fill remaining slots
-            shown = []
-            for placetype in by_type:
-                if by_type[placetype] and len(shown) < 8:
-                    place = by_type[placetype][0]
-                    shown.append(place)
-                    display = f"{place.name} ({place.placetype})"
-                    yield Completion(
-                        place.name,
-                        start_position=-len(text),
-                        display=display,
-                        display_meta=place.country or "",
-                    )
+        # Run async search in sync context. nest_asyncio lets it reuse the
+        # explorer's loop, which the connector's engine is bound to,
+        # instead of building and tearing down a loop per keystroke
+        places = asyncio.get_event_loop().run_until_complete(self._search(text))
+        yield from self._completions(text, places)
 
-            # Fill remaining slots with any remaining places
-            for place in results.places:
-                if place not in shown and len(shown) < 8:
-                    shown.append(place)
-                    display = f"{place.name} ({place.placetype})"
-                    yield Completion(
-                        place.name,
-                        start_position=-len(text),
-                        display=display,
-                        display_meta=place.country or "",
-                    )
+    async def get_completions_async(self, document: Document, complete_event):
+        """Get place name completions without blocking the prompt."""
+        text = document.text.strip()
+        if len(text) < 2:
+            return
+
+        # prompt_toolkit awaits this on the loop the prompt runs on, so the
+        # search no longer stalls rendering while the database answers
+        for completion in self._completions(text, await self._search(text)):
+            yield completion
+
+    def _completions(self, text: str, places: list):
+        """Completions for places, one per placetype first."""
+        # Prioritize diversity of place types: the first place of each type,
+        # then the rest in result order, in a single pass
+        seen_types = set()
+        primary, overflow = [], []
+        for place in places:
+            if place.placetype not in seen_types and len(primary) < 8:
+                seen_types.add(place.placetype)
+                primary.append(place)
+            elif len(overflow) < 8:
+                overflow.append(place)
+
+        for place in primary + overflow[: 8 - len(primary)]:
+            yield Completion(
+                place.name,
+                start_position=-len(text),
+                display=f"{place.name} ({place.placetype})",
+                display_meta=place.country or "",
+            )
 
 
 class InteractiveExplorer:
@@ -165,25 +287,46 @@ class InteractiveExplorer:
         self.current_place = None
         self.history = []
 
+        # The database is opened read-only, so aggregate lookups can be
+        # kept for the whole session
+        self._top_cities = None
+        self._summary = None
+        self._hierarchy_cache = {}  # (place id, "ancestors"/"descendants") -> list
+
+        # Numbered menu options
+        self._menu = {
+            "1": lambda: self._prompt_then(
+                "Enter city name: ", lambda q: self.search_with_type(q, "locality")
+            ),
+            "2": lambda: self._prompt_then(
+                "Enter city name: ", self._search_neighborhoods_prompt
+            ),
+            "3": lambda: self._prompt_then(
+                "Enter county name: ", lambda q: self.search_with_type(q, "county")
+            ),
+            "4": self.browse_top_cities,
+            "5": self.show_stats,
+            "6": lambda: self._prompt_then("Enter search term: ", self.search),
+            "7": self.guided_tour,
+        }
+
+        # Text commands, each called with the rest of the input line
+        self._commands = {
+            "search": self.search,
+            "show": self.show_place,
+            "ancestors": lambda args: self.show_ancestors(),
+            "descendants": lambda args: self.show_descendants(),
+            "nearby": self.find_nearby,
+            "export": lambda args: self.export_current(),
+            "stats": lambda args: self.show_stats(),
+            "back": lambda args: self.go_back(),
+            "help": lambda args: self.show_help(),
+            "?": lambda args: self.show_help(),
+        }
+
     async def run(self):
         """Run the interactive explorer."""
-        console.print(
-            Panel(
-                "[bold cyan]🗺️  WhosOnFirst Interactive Explorer[/bold cyan]\n\n"
-                "[yellow]Quick Start Menu:[/yellow]\n"
-                "  [bold]1[/bold] - Search cities\n"
-                "  [bold]2[/bold] - Search neighborhoods (within city)\n"
-                "  [bold]3[/bold] - Search counties\n"
-                "  [bold]4[/bold] - Browse top cities\n"
-                "  [bold]5[/bold] - Show database stats\n"
-                "  [bold]6[/bold] - Custom search\n"
-                "  [bold green]7[/bold green] - 🎭 Guided Tour (Interactive Demo)\n"
-                "  [bold]q[/bold] - Quit\n\n"
-                "[dim]Or type a command: search, show <id>, stats, export, quit[/dim]",
-                title="Welcome",
-                border_style="cyan",
-            )
-        )
+        console.print(WELCOME_PANEL)
 
         while True:
             try:
@@ -199,107 +342,32 @@ class InteractiveExplorer:
                 if not user_input:
                     continue
 
-                # Handle menu options first
-                if user_input == "1":
-                    # Search cities
-                    try:
-                        city_name = prompt("Enter city name: ").strip()
-                        if city_name:
-                            await self.search_with_type(city_name, "locality")
-                    except (KeyboardInterrupt, EOFError):
-                        console.print("\n[dim]Cancelled[/dim]")
-                        continue
-
-                elif user_input == "2":
-                    # Search neighborhoods within a city
-                    try:
-                        city_name = prompt("Enter city name: ").strip()
-                        if city_name:
-                            neighborhood = prompt(
-                                "Enter neighborhood name (or press Enter for all): "
-                            ).strip()
-                            await self.search_neighborhoods_in_city(
-                                city_name, neighborhood
-                            )
-                    except (KeyboardInterrupt, EOFError):
-                        console.print("\n[dim]Cancelled[/dim]")
-                        continue
-
-                elif user_input == "3":
-                    # Search counties
-                    try:
-                        county_name = prompt("Enter county name: ").strip()
-                        if county_name:
-                            await self.search_with_type(county_name, "county")
-                    except (KeyboardInterrupt, EOFError):
-                        console.print("\n[dim]Cancelled[/dim]")
-                        continue
-
-                elif user_input == "4":
-                    # Browse top cities
-                    await self.browse_top_cities()
-
-                elif user_input == "5":
-                    # Show stats
-                    await self.show_stats()
-
-                elif user_input == "6":
-                    # Custom search
-                    try:
-                        query = prompt("Enter search term: ").strip()
-                        if query:
-                            await self.search(query)
-                    except (KeyboardInterrupt, EOFError):
-                        console.print("\n[dim]Cancelled[/dim]")
-                        continue
-
-                elif user_input == "7":
-                    # Guided tour
-                    await self.guided_tour()
-
-                elif user_input.lower() in ["q", "quit", "exit"]:
+                if user_input.lower() in ["q", "quit", "exit"]:
                     console.print("[yellow]Goodbye! 👋[/yellow]")
                     break
 
-                else:
-                    # Parse command
-                    parts = user_input.split(maxsplit=1)
-                    cmd = parts[0].lower()
-                    args = parts[1] if len(parts) > 1 else ""
-
-                    # Handle text commands
-                    if cmd == "search":
-                        await self.search(args)
-
-                    elif cmd == "show":
-                        await self.show_place(args)
-
-                    elif cmd == "ancestors":
-                        await self.show_ancestors()
-
-                    elif cmd == "descendants":
-                        await self.show_descendants()
-
-                    elif cmd == "nearby":
-                        await self.find_nearby(args)
-
-                    elif cmd == "export":
-                        await self.export_current()
-
-                    elif cmd == "stats":
-                        await self.show_stats()
+                # Handle menu options first
+                menu_action = self._menu.get(user_input)
+                if menu_action:
+                    await menu_action()
+                    continue
 
-                    elif cmd == "back":
-                        self.go_back()
+                # Parse command
+                parts = user_input.split(maxsplit=1)
+                cmd = parts[0].lower()
+                args = parts[1] if len(parts) > 1 else ""
 
-                    elif cmd == "help" or cmd == "?":
-                        self.show_help()
+                handler = self._commands.get(cmd)
+                if handler is None:
+                    console.print(f"[red]Unknown command: {cmd}[/red]")
+                    console.print(
+                        "[dim]Type 'help' for commands or use menu options 1-6[/dim]"
+                    )
+                    continue
 
-                    else:
-                        console.print(f"[red]Unknown command: {cmd}[/red]")
-                        console.print(
-                            "[dim]Type 'help' for commands or use menu options 1-6[/dim]"
-                        )
+                result = handler(args)
+                if result is not None:
+                    await result
 
             except KeyboardInterrupt:
                 console.print("\n[yellow]Exiting... Goodbye! 👋[/yellow]")
@@ -310,6 +378,22 @@ class InteractiveExplorer:
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
 
+    async def _prompt_then(self, message: str, action):
+        """Prompt for a value and pass it to action; Ctrl+C cancels."""
+        try:
+            value = prompt(message).strip()
+            if value:
+                await action(value)
+        except (KeyboardInterrupt, EOFError):
+            console.print("\n[dim]Cancelled[/dim]")
+
+    async def _search_neighborhoods_prompt(self, city_name: str):
+        """Ask for an optional neighborhood name, then search the city."""
+        neighborhood = prompt(
+            "Enter neighborhood name (or press Enter for all): "
+        ).strip()
+        await self.search_neighborhoods_in_city(city_name, neighborhood)
+
     async def search_with_type(self, query: str, placetype: str):
         """Search for places with a specific type."""
         filters = WOFSearchFilters(name=query, placetype=placetype, limit=20)
@@ -363,8 +447,12 @@ class InteractiveExplorer:
 
     async def browse_top_cities(self):
         """Show top cities by coverage."""
-        with console.status("[cyan]Loading top cities...[/cyan]"):
-            cities = await self.connector.explorer.top_cities_by_coverage(limit=20)
+        if self._top_cities is None:
+            with console.status("[cyan]Loading top cities...[/cyan]"):
+                self._top_cities = await self.connector.explorer.top_cities_by_coverage(
+                    limit=20
+                )
+        cities = self._top_cities
 
         if not cities:
             console.print("[yellow]No cities found[/yellow]")
@@ -412,34 +500,25 @@ class InteractiveExplorer:
 
     async def display_all_results(self, cursor, title: str):
         """Display ALL search results in a scrollable table."""
+        if not console.is_terminal:
+            # Piped output: plain tab-separated rows, without building a table
+            sys.stdout.writelines(
+                f"{i}\t{p.id}\t{p.name}\t{p.placetype}\t"
+                f"{p.region or p.country or ''}\t"
+                f"{'current' if p.is_current else 'ceased'}\n"
+                for i, p in enumerate(cursor.places, 1)
+            )
+            return
+
         console.print(f"\n[cyan]Showing all {cursor.total_count} results...[/cyan]\n")
 
         # Simple table without grouping
-        table = Table(
-            title=f"{title} (all {cursor.total_count} results)",
-            show_header=True,
-            header_style="bold cyan",
+        table = new_search_table(
+            f"{title} (all {cursor.total_count} results)", index_width=4
         )
-        table.add_column("#", width=4)
-        table.add_column("WOF ID", style="dim", width=10)
-        table.add_column("Name", style="white", max_width=30)
-        table.add_column("Type", style="cyan", width=12)
-        table.add_column("Region/State", style="yellow", width=15)
-        table.add_column("Status", style="green", width=8)
 
-        places_list = []
-        for i, place in enumerate(cursor.places, 1):
-            # Determine status
-            status = "✓" if place.is_current else "ceased"
-
-            # Get region/state if available
-            region = place.region or place.country or ""
-
-            # Truncate long names
-            name = place.name[:30] + "..." if len(place.name) > 30 else place.name
-
-            table.add_row(str(i), str(place.id), name, place.placetype, region, status)
-            places_list.append(place)
+        places_list = list(cursor.places)
+        add_search_rows(table, places_list)
 
         console.print(table)
 
@@ -466,27 +545,10 @@ class InteractiveExplorer:
             title = f"{title} (showing {display_limit} of {cursor.total_count})"
 
         # Simple table without grouping
-        table = Table(title=title, show_header=True, header_style="bold cyan")
-        table.add_column("#", width=3)
-        table.add_column("WOF ID", style="dim", width=10)
-        table.add_column("Name", style="white", max_width=30)
-        table.add_column("Type", style="cyan", width=12)
-        table.add_column("Region/State", style="yellow", width=15)
-        table.add_column("Status", style="green", width=8)
-
-        places_list = []
-        for i, place in enumerate(cursor.places[:display_limit], 1):
-            # Determine status
-            status = "✓" if place.is_current else "ceased"
+        table = new_search_table(title)
 
-            # Get region/state if available
-            region = place.region or place.country or ""
-
-            # Truncate long names
-            name = place.name[:30] + "..." if len(place.name) > 30 else place.name
-
-            table.add_row(str(i), str(place.id), name, place.placetype, region, status)
-            places_list.append(place)
+        places_list = cursor.places[:display_limit]
+        add_search_rows(table, places_list)
 
         console.print(table)
 
@@ -550,9 +612,11 @@ class InteractiveExplorer:
             console.print("[red]Please provide a valid place ID[/red]")
             return
 
+        # Geometry is only loaded on export; here we just check it exists
         with console.status(f"[cyan]Loading place {place_id}...[/cyan]"):
-            places = await self.connector.get_places(
-                [int(place_id)], include_geometry=True
+            places, geometry_ids = await asyncio.gather(
+                self.connector.get_places([int(place_id)]),
+                self.connector.get_geometry_ids([int(place_id)]),
             )
 
         if not places:
@@ -577,11 +641,24 @@ class InteractiveExplorer:
                     if place.latitude
                     else "Unknown"
                 ),
-                "Has Geometry": "Yes" if place.geometry else "No",
+                "Has Geometry": "Yes" if place.id in geometry_ids else "No",
             },
             title=place.name,
         )
 
+    async def _hierarchy(self, direction: str):
+        """Ancestors or descendants of the current place, cached per place."""
+        key = (self.current_place.id, direction)
+        if key not in self._hierarchy_cache:
+            with console.status(f"[cyan]Loading {direction}...[/cyan]"):
+                hierarchy = WOFHierarchyCursor(self.current_place, self.connector)
+                if direction == "ancestors":
+                    places = await hierarchy.fetch_ancestors()
+                else:
+                    places = await hierarchy.fetch_descendants()
+            self._hierarchy_cache[key] = places
+        return self._hierarchy_cache[key]
+
     async def show_ancestors(self):
         """Show ancestors hierarchy."""
         if not self.current_place:
@@ -590,9 +667,7 @@ class InteractiveExplorer:
             )
             return
 
-        with console.status("[cyan]Loading ancestors...[/cyan]"):
-            hierarchy = WOFHierarchyCursor(self.current_place, self.connector)
-            ancestors = await hierarchy.fetch_ancestors()
+        ancestors = await self._hierarchy("ancestors")
 
         if not ancestors:
             console.print("[yellow]No ancestors found[/yellow]")
@@ -616,32 +691,26 @@ class InteractiveExplorer:
             )
             return
 
-        with console.status("[cyan]Loading descendants...[/cyan]"):
-            hierarchy = WOFHierarchyCursor(self.current_place, self.connector)
-            descendants = await hierarchy.fetch_descendants()
+        descendants = await self._hierarchy("descendants")
 
         if not descendants:
             console.print("[yellow]No descendants found[/yellow]")
             return
 
-        # Group by placetype
-        by_type = {}
-        for place in descendants:
-            if place.placetype not in by_type:
-                by_type[place.placetype] = []
-            by_type[place.placetype].append(place)
-
-        # Display as tree
+        # Display as tree, one branch per placetype
         tree = Tree(
             f"[bold]{self.current_place.name}[/bold] [dim]({self.current_place.placetype})[/dim]"
         )
 
-        for placetype, places in by_type.items():
-            branch = tree.add(f"[cyan]{placetype}[/cyan] ({len(places)})")
-            for place in places[:5]:  # Show first 5
+        by_type = attrgetter("placetype")
+        for placetype, group in groupby(sorted(descendants, key=by_type), by_type):
+            shown = list(islice(group, 5))  # Show first 5, only count the rest
+            remaining = sum(1 for _ in group)
+            branch = tree.add(f"[cyan]{placetype}[/cyan] ({len(shown) + remaining})")
+            for place in shown:
                 branch.add(f"{place.name}")
-            if len(places) > 5:
-                branch.add(f"[dim]... and {len(places) - 5} more[/dim]")
+            if remaining:
+                branch.add(f"[dim]... and {remaining} more[/dim]")
 
         console.print(Panel(tree, title="Descendants", border_style="green"))
 
@@ -685,9 +754,25 @@ class InteractiveExplorer:
         table.add_column("Type", style="cyan")
         table.add_column("Distance", style="yellow")
 
-        for place in cursor.places[:10]:
-            # Calculate rough distance (would need proper calculation)
-            table.add_row(place.name, place.placetype, f"~{km:.1f}km")
+        # Great-circle distance from the current place, nearest first
+        origin = WOFCentroid(
+            lat=self.current_place.latitude, lon=self.current_place.longitude
+        )
+        nearby = sorted(
+            [
+                (
+                    origin.haversine_distance_to(
+                        WOFCentroid(lat=place.latitude, lon=place.longitude)
+                    ),
+                    place,
+                )
+                for place in cursor.places
+                if place.latitude is not None and place.longitude is not None
+            ],
+            key=itemgetter(0),
+        )
+        for place_km, place in nearby[:10]:
+            table.add_row(place.name, place.placetype, f"{place_km:.1f}km")
 
         console.print(table)
 
@@ -705,17 +790,20 @@ class InteractiveExplorer:
 
         if places:
             collection = PlaceCollection(places=places)
-            geojson = collection.to_geojson_string()
 
-            # Save to file
+            # Stream to file feature by feature, off the event loop
             filename = f"wof-export-{self.current_place.id}.geojson"
-            Path(filename).write_text(geojson)
+            await asyncio.to_thread(collection.write_geojson, filename)
             console.print(f"[green]✓ Exported to {filename}[/green]")
 
     async def show_stats(self):
         """Show database statistics."""
-        with console.status("[cyan]Loading statistics...[/cyan]"):
-            summary = await self.connector.explorer.database_summary()
+        if self._summary is None:
+            with console.status("[cyan]Loading statistics...[/cyan]"):
+                self._summary = await load_database_summary(
+                    self.connector, self.connector.db_path
+                )
+        summary = self._summary
 
         # Display stats using our beautiful formatters
         stats = {
@@ -776,6 +864,20 @@ class InteractiveExplorer:
         )
         console.print("[dim]Press Enter after each step to continue...[/dim]\n")
 
+        # The tour's later lookups don't depend on anything the user does, so
+        # start them now; the connector's read pool runs them alongside the
+        # stats query while earlier steps are on screen
+        chicago_task = asyncio.create_task(
+            self.connector.search(
+                WOFSearchFilters(name="Chicago", placetype="locality", limit=1)
+            )
+        )
+        cities_task = asyncio.create_task(
+            self.connector.search(
+                WOFSearchFilters(placetype="locality", country="US", limit=5)
+            )
+        )
+
         try:
             # Step 1: Database Overview
             prompt(
@@ -790,9 +892,7 @@ class InteractiveExplorer:
 
             # Search for Chicago
             with console.status("[cyan]Loading Chicago...[/cyan]"):
-                chicago_cursor = await self.connector.search(
-                    WOFSearchFilters(name="Chicago", placetype="locality", limit=1)
-                )
+                chicago_cursor = await chicago_task
 
             if chicago_cursor.places:
                 chicago = chicago_cursor.places[0]
@@ -842,11 +942,14 @@ class InteractiveExplorer:
 
             # Get some sample data
             with console.status("[cyan]Loading sample cities...[/cyan]"):
-                cities_cursor = await self.connector.search(
-                    WOFSearchFilters(placetype="locality", country="US", limit=5)
-                )
+                cities_cursor = await cities_task
 
             if cities_cursor.places:
+                city_rows = [
+                    [p.name, p.region or "N/A", str(p.id)]
+                    for p in cities_cursor.places[:3]
+                ]
+
                 # Show different table styles
                 for style_name, style in [
                     ("Simple", TableStyle.SIMPLE),
@@ -861,8 +964,7 @@ class InteractiveExplorer:
                         headers=["City", "State", "WOF ID"], config=config
                     )
 
-                    for p in cities_cursor.places[:3]:
-                        display.add_row([p.name, p.region or "N/A", str(p.id)])
+                    display.add_rows(city_rows)
 
                     console.print(display.render())
 
@@ -916,6 +1018,10 @@ class InteractiveExplorer:
 
         except (KeyboardInterrupt, EOFError):
             console.print("\n[yellow]Tour cancelled[/yellow]")
+        finally:
+            # Drop lookups a cancelled tour never reached
+            chicago_task.cancel()
+            cities_task.cancel()
 
     def show_help(self):
         """Show help menu."""
@@ -1009,12 +1115,17 @@ def search(
 
         # Output based on format
         if output == "json":
-            places_dict = [p.model_dump() for p in cursor.places]
-            print(json.dumps(places_dict, indent=2))
+            # Write one place at a time; pydantic encodes dates itself
+            sys.stdout.write("[\n")
+            for i, place in enumerate(cursor.places):
+                if i:
+                    sys.stdout.write(",\n")
+                sys.stdout.write(indent(place.model_dump_json(indent=2), "  "))
+            sys.stdout.write("\n]\n")
         elif output == "geojson":
-            places = await cursor.fetch_all(include_geometry=True)
-            collection = PlaceCollection(places=places)
-            print(collection.to_geojson_string())
+            collection = await cursor.fetch_all(include_geometry=True)
+            collection.write_geojson(sys.stdout)
+            sys.stdout.write("\n")
         else:
             # Default table output
             table = Table(
@@ -1059,12 +1170,14 @@ def stats(
         await connector.connect()
 
         with console.status("[cyan]Loading statistics...[/cyan]"):
-            summary = await connector.explorer.database_summary()
-
             if detailed:
-                # Get additional stats
-                top_cities = await connector.explorer.top_cities_by_coverage()
-                placetypes = await connector.explorer.discover_placetypes()
+                # Independent queries, run side by side on pooled connections
+                summary, top_cities = await asyncio.gather(
+                    load_database_summary(connector, database),
+                    connector.explorer.top_cities_by_coverage(),
+                )
+            else:
+                summary = await load_database_summary(connector, database)
 
         # Display basic stats
         # Extract key statistics from the summary
@@ -1093,11 +1206,16 @@ def stats(
                         f"  • {city['name']}: {city.get('descendant_count', 0):,} places"
                     )
 
-            # Show placetype distribution
+            # Show placetype distribution, already counted by the summary
+            placetypes = sorted(
+                summary.get("by_placetype", {}).items(),
+                key=itemgetter(1),
+                reverse=True,
+            )
             if placetypes:
                 console.print("\n[bold cyan]Place Types:[/bold cyan]")
-                for pt in placetypes[:10]:
-                    console.print(f"  • {pt['placetype']}: {pt['count']:,}")
+                for placetype, count in placetypes[:10]:
+                    console.print(f"  • {placetype}: {count:,}")
 
         await connector.disconnect()
 
@@ -1137,7 +1255,6 @@ def demo(
             TableStyle,
             print_comparison,
         )
-        import time
 
         connector = WOFConnector(str(database))
         await connector.connect()
@@ -1168,7 +1285,7 @@ def demo(
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 2. Progress Indicators
         console.print("\n[bold yellow]2. Progress Indicators[/bold yellow]")
@@ -1186,19 +1303,18 @@ def demo(
             task2 = progress.add_task("[green]Processing places...", total=200)
             task3 = progress.add_task("[yellow]Building index...", total=150)
 
-            for i in range(100):
-                time.sleep(0.01)
-                progress.update(task1, advance=1)
-                if i % 2 == 0:
-                    progress.update(task2, advance=2)
-                if i % 3 == 0:
-                    progress.update(task3, advance=1.5)
+            # 20 frames over a second, without blocking the event loop
+            for _ in range(20):
+                await asyncio.sleep(0.05)
+                progress.update(task1, advance=5)
+                progress.update(task2, advance=5)
+                progress.update(task3, advance=2.5)
 
         if not auto_mode:
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 3. Table Styles
         console.print("\n[bold yellow]3. Table Display Styles[/bold yellow]")
@@ -1222,15 +1338,14 @@ def demo(
             console.print(f"\n[cyan]{name}:[/cyan]")
             config = TableConfig(style=style, align={"Population": "right"})
             table = TableDisplay(headers, config)
-            for row in sample_data:
-                table.add_row(row)
+            table.add_rows(sample_data)
             print(table.render())
 
         if not auto_mode:
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 4. ASCII Map Visualization
         console.print("\n[bold yellow]4. ASCII Map Visualization[/bold yellow]")
@@ -1260,7 +1375,7 @@ def demo(
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 5. Comparison Tables
         console.print("\n[bold yellow]5. Comparison Tables[/bold yellow]")
@@ -1288,7 +1403,7 @@ def demo(
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 6. Rich Formatted Output
         console.print("\n[bold yellow]6. Rich Formatted Output[/bold yellow]")
@@ -1318,7 +1433,7 @@ def demo(
             console.print("\n[dim]Press Enter to continue...[/dim]")
             input()
         else:
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         # 7. Live Search Results
         console.print("\n[bold yellow]7. Live Data from Database[/bold yellow]")
@@ -1399,7 +1514,15 @@ def export(
 
         # Export based on format
         if format == "geojson":
-            output = collection.to_geojson_string()
+            # Stream features straight to the destination
+            if output_file:
+                collection.write_geojson(output_file)
+                console.print(f"[green]✓ Exported to {output_file}[/green]")
+            else:
+                collection.write_geojson(sys.stdout)
+                sys.stdout.write("\n")
+            await connector.disconnect()
+            return
         elif format == "csv":
             output = collection.to_csv()
         elif format == "wkt":
@@ -1420,24 +1543,34 @@ def export(
     asyncio.run(run())
 
 
-# Import download command from original script
-# We'll import it dynamically to avoid circular imports
-import importlib.util  # noqa: E402
+@lru_cache(maxsize=1)
+def load_download_module():
+    """Load wof-download.py once, the first time it is needed."""
+    spec = importlib.util.spec_from_file_location(
+        "wof_download", Path(__file__).parent / "wof-download.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
-spec = importlib.util.spec_from_file_location(
-    "wof_download", Path(__file__).parent / "wof-download.py"
-)
-wof_download_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(wof_download_module)
 
-# Add download as a subcommand
-app.command(name="download")(wof_download_module.main)
+# Download command from the downloader script. It is only loaded when the
+# command runs, so other commands don't pay for importing aiohttp & co.
+@app.command(
+    name="download",
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
+    add_help_option=False,
+)
+def download(ctx: typer.Context):
+    """Download WhosOnFirst databases (see 'download --help')."""
+    load_download_module().app(args=ctx.args, prog_name=ctx.command_path)
 
 
 if __name__ == "__main__":
-    # Show help if no command provided
-    import sys
+    # Enable nested asyncio so the completer can run searches from prompts
+    nest_asyncio.apply()
 
+    # Show help if no command provided
     if len(sys.argv) == 1:
         sys.argv.append("--help")
     app()
@@ -7,7 +7,7 @@ Infrastructure Subsystem Pattern.
 """
 
 import logging
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Set, Union
 from pathlib import Path
 
 from wof_explorer.base import WOFConnectorBase
@@ -164,6 +164,28 @@ class SQLiteWOFConnector(WOFConnectorBase):
             raise RuntimeError("Operations not initialized")
         return await self.operations.execute_batch_query(place_ids, include_geometry)
 
+    async def get_geometries(self, place_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get geometry for multiple places, reading only the geojson table.
+
+        Delegates to operations component.
+        """
+        self._ensure_connected()
+        if self.operations is None:
+            raise RuntimeError("Operations not initialized")
+        return await self.operations.execute_geometry_query(place_ids)
+
+    async def get_geometry_ids(self, place_ids: List[int]) -> Set[int]:
+        """
+        Find which places have geometry, without reading the GeoJSON.
+
+        Delegates to operations component.
+        """
+        self._ensure_connected()
+        if self.operations is None:
+            raise RuntimeError("Operations not initialized")
+        return await self.operations.execute_geometry_ids_query(place_ids)
+
     # ============= HIERARCHY OPERATIONS =============
 
     async def get_ancestors(self, place_id: int) -> List[WOFAncestor]:
@@ -177,6 +199,19 @@ class SQLiteWOFConnector(WOFConnectorBase):
             raise RuntimeError("Operations not initialized")
         return await self.operations.execute_ancestors_query(place_id)
 
+    async def get_ancestors_batch(
+        self, place_ids: List[int]
+    ) -> Dict[int, List[WOFAncestor]]:
+        """
+        Get ancestors for multiple places.
+
+        Delegates to operations component.
+        """
+        self._ensure_connected()
+        if self.operations is None:
+            raise RuntimeError("Operations not initialized")
+        return await self.operations.execute_batch_ancestors_query(place_ids)
+
     async def get_descendants(
         self, place_id: int, filters: Optional[WOFFilters] = None
     ) -> List[WOFPlace]:
@@ -5,9 +5,10 @@ Executes queries and transforms results.
 Part of the SQLite backend refactoring following Infrastructure Subsystem Pattern.
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Any, Dict, Set, Union
 from datetime import datetime
 
 from sqlalchemy import select, and_
@@ -24,6 +25,10 @@ from .models import DBSearchResult, InternalSearchResult
 
 logger = logging.getLogger(__name__)
 
+# SQLite has a limit of 999 variables in a single query, so ID lists are
+# chunked; 900 leaves headroom for any extra bound parameters
+CHUNK_SIZE = 900
+
 
 class SQLiteOperations:
     """Executes database operations and transforms results."""
@@ -46,6 +51,11 @@ class SQLiteOperations:
         self.queries = query_builder
         self.connector = connector
 
+        # Point lookups queued during the current event-loop tick, keyed by
+        # include_geometry, then place_id -> waiting futures
+        self._pending_lookups: Dict[bool, Dict[int, List[asyncio.Future]]] = {}
+        self._lookup_tasks: Set[asyncio.Task] = set()
+
     @staticmethod
     def _coerce_placetype(value: Any) -> PlaceType:
         """Convert raw database values to PlaceType with graceful fallback."""
@@ -96,7 +106,7 @@ class SQLiteOperations:
         db_result = DBSearchResult(
             rows=list(rows),
             total_count=len(rows),
-            query_executed=str(query),
+            query_executed=self.queries.render_search_query(filters, query),
             execution_time_ms=execution_time,
             source_db=(
                 str(self.session.db_path) if hasattr(self.session, "db_path") else None
@@ -130,6 +140,10 @@ class SQLiteOperations:
         """
         Get single place by ID.
 
+        Lookups issued concurrently (e.g. via ``asyncio.gather``) within the
+        same event-loop tick are coalesced into one batch query, so N
+        concurrent calls cost a single round-trip to the database thread.
+
         Args:
             place_id: WhosOnFirst place ID
             include_geometry: Whether to include geometry data
@@ -137,29 +151,58 @@ class SQLiteOperations:
         Returns:
             Place object or None if not found
         """
-        # Build query
-        query = self.queries.build_batch_query([place_id], include_geometry)
-
-        # Get the engine
-        engine = self.session.get_async_engine()
-        if not engine:
+        if not self.session.get_async_engine():
             raise RuntimeError(
                 "Not connected. Session manager must be connected first."
             )
 
-        # Execute query
-        async with engine.connect() as conn:
-            result = await conn.execute(query)
-            row = result.first()
-
-        if row:
-            # Transform and return
-            if include_geometry and "geojson" in row._mapping:
-                return self.transform_row_with_geometry(row)
-            else:
-                return self.transform_row_to_place(row)
+        loop = asyncio.get_running_loop()
+        pending = self._pending_lookups.get(include_geometry)
+        if pending is None:
+            # First lookup this tick - flush once everything queued has run
+            pending = self._pending_lookups[include_geometry] = {}
+            loop.call_soon(self._flush_lookups, include_geometry)
+
+        future: asyncio.Future = loop.create_future()
+        pending.setdefault(place_id, []).append(future)
+        return await future
+
+    def _flush_lookups(self, include_geometry: bool) -> None:
+        """Dispatch all point lookups queued during the last tick."""
+        pending = self._pending_lookups.pop(include_geometry, None)
+        if not pending:
+            return
+        task = asyncio.ensure_future(self._resolve_lookups(pending, include_geometry))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._lookup_tasks.add(task)
+        task.add_done_callback(self._lookup_tasks.discard)
+
+    async def _resolve_lookups(
+        self, pending: Dict[int, List[asyncio.Future]], include_geometry: bool
+    ) -> None:
+        """Run one batch query for queued lookups and resolve their futures."""
+        try:
+            places = await self.execute_batch_query(list(pending), include_geometry)
+        except BaseException as e:
+            # Every waiter shares this batch, so each one gets its failure,
+            # cancellation included, rather than waiting forever
+            for futures in pending.values():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
 
-        return None  # Place not found
+        by_id = {place.id: place for place in places}
+        for place_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(by_id.get(place_id))
 
     async def execute_hierarchy_query(
         self, place_id: int, direction: str, filters: Optional[WOFFilters] = None
@@ -212,6 +255,26 @@ class SQLiteOperations:
         Returns:
             List of ancestors ordered from immediate parent to root
         """
+        ancestors = await self.execute_batch_ancestors_query([place_id])
+        return ancestors.get(place_id, [])
+
+    async def execute_batch_ancestors_query(
+        self, place_ids: List[int]
+    ) -> Dict[int, List[WOFAncestor]]:
+        """
+        Get ancestors for multiple places.
+
+        The ancestor links for all places are read first, then every distinct
+        ancestor is looked up once with an ``IN (...)`` query, so the number
+        of queries does not grow with the number of places or ancestors.
+
+        Args:
+            place_ids: IDs of the places
+
+        Returns:
+            Mapping of place ID to its ancestors, ordered from immediate
+            parent to root (places without ancestors map to an empty list)
+        """
         # Get the engine
         engine = self.session.get_async_engine()
         if not engine:
@@ -219,62 +282,80 @@ class SQLiteOperations:
                 "Not connected. Session manager must be connected first."
             )
 
+        unique_ids = list(dict.fromkeys(place_ids))
+        if not unique_ids:
+            return {}
+
         ancestors_table = self.queries.ancestors_table
         spr_table = self.queries.spr_table
 
         if ancestors_table is None or spr_table is None:
             logger.warning("Ancestors or SPR table not available for ancestors query")
-            return []
+            return {}
+
+        links: Dict[int, List[Row]] = {place_id: [] for place_id in unique_ids}
+        ancestor_places: Dict[int, Row] = {}
 
         async with engine.connect() as conn:
-            # Get all ancestor IDs for this place (excluding the place itself)
-            ancestor_query = select(
-                ancestors_table.c.ancestor_id, ancestors_table.c.ancestor_placetype
-            ).where(
-                and_(
-                    ancestors_table.c.id == place_id,
-                    ancestors_table.c.ancestor_id != place_id,  # Exclude self
+            # Get all ancestor IDs for these places (excluding the places themselves)
+            for i in range(0, len(unique_ids), CHUNK_SIZE):
+                ancestor_query = select(
+                    ancestors_table.c.id,
+                    ancestors_table.c.ancestor_id,
+                    ancestors_table.c.ancestor_placetype,
+                ).where(
+                    and_(
+                        ancestors_table.c.id.in_(unique_ids[i : i + CHUNK_SIZE]),
+                        ancestors_table.c.ancestor_id != ancestors_table.c.id,
+                    )
+                )
+                result = await conn.execute(ancestor_query)
+                for row in result.fetchall():
+                    links[row.id].append(row)
+
+            # Get place data for each distinct ancestor in one pass
+            ancestor_ids = list(
+                dict.fromkeys(
+                    row.ancestor_id for rows in links.values() for row in rows
                 )
             )
-            result = await conn.execute(ancestor_query)
-            ancestor_rows = result.fetchall()
-
-            if not ancestor_rows:
-                return []
-
-            # Get place data for each ancestor
-            ancestors = []
-            # Define hierarchy levels
-            hierarchy_order = [
-                "neighbourhood",
-                "locality",
-                "borough",
-                "county",
-                "region",
-                "country",
-                "continent",
-                "planet",
-            ]
-
-            for row in ancestor_rows:
-                ancestor_id = row.ancestor_id
-                ancestor_placetype = row.ancestor_placetype
-
-                # Get the ancestor place data
-                assert spr_table is not None  # Already checked above
-                place_query = select(spr_table).where(spr_table.c.id == ancestor_id)
+            for i in range(0, len(ancestor_ids), CHUNK_SIZE):
+                place_query = select(spr_table).where(
+                    spr_table.c.id.in_(ancestor_ids[i : i + CHUNK_SIZE])
+                )
                 result = await conn.execute(place_query)
-                place_row = result.first()
-
-                if place_row:
-                    # Calculate level (0 = immediate parent, higher = more distant)
-                    level = (
-                        hierarchy_order.index(ancestor_placetype)
-                        if ancestor_placetype in hierarchy_order
-                        else 99
-                    )
+                for place_row in result.fetchall():
+                    ancestor_places[place_row.id] = place_row
+
+        # Define hierarchy levels
+        hierarchy_order = [
+            "neighbourhood",
+            "locality",
+            "borough",
+            "county",
+            "region",
+            "country",
+            "continent",
+            "planet",
+        ]
+
+        ancestors_by_place: Dict[int, List[WOFAncestor]] = {}
+        for place_id, rows in links.items():
+            ancestors = []
+            for row in rows:
+                place_row = ancestor_places.get(row.ancestor_id)
+                if place_row is None:
+                    continue
+
+                # Calculate level (0 = immediate parent, higher = more distant)
+                level = (
+                    hierarchy_order.index(row.ancestor_placetype)
+                    if row.ancestor_placetype in hierarchy_order
+                    else 99
+                )
 
-                    ancestor = WOFAncestor(
+                ancestors.append(
+                    WOFAncestor(
                         id=place_row.id,
                         name=place_row.name,
                         placetype=self._coerce_placetype(place_row.placetype),
@@ -283,12 +364,13 @@ class SQLiteOperations:
                         ),
                         level=level,
                     )
-                    ancestors.append(ancestor)
+                )
 
             # Sort ancestors by hierarchy level (immediate parent first)
             ancestors.sort(key=lambda a: a.level)
+            ancestors_by_place[place_id] = ancestors
 
-        return ancestors
+        return ancestors_by_place
 
     async def execute_batch_query(
         self, place_ids: List[int], include_geometry: bool = False
@@ -296,6 +378,10 @@ class SQLiteOperations:
         """
         Get multiple places by IDs.
 
+        IDs are fetched with set-oriented ``IN (...)`` queries rather than one
+        query per ID. Results follow the order of ``place_ids`` (duplicates
+        collapsed), regardless of the order SQLite returns rows in.
+
         Args:
             place_ids: List of place IDs
             include_geometry: Whether to include geometry
@@ -303,67 +389,137 @@ class SQLiteOperations:
         Returns:
             List of places (may be shorter than place_ids if some not found)
         """
-        # SQLite has a limit of 999 variables in a single query
-        # We need to chunk the IDs to avoid hitting this limit
-        CHUNK_SIZE = 900  # Use 900 to be safe with the 999 limit
+        unique_ids = list(dict.fromkeys(place_ids))
+        if not unique_ids:
+            return []
+
+        # Chunks are independent, so run them concurrently on pooled connections
+        chunks = await asyncio.gather(
+            *[
+                self._fetch_batch_chunk(
+                    unique_ids[i : i + CHUNK_SIZE], include_geometry
+                )
+                for i in range(0, len(unique_ids), CHUNK_SIZE)
+            ]
+        )
+
+        by_id = {place.id: place for chunk in chunks for place in chunk}
+        return [by_id[place_id] for place_id in unique_ids if place_id in by_id]
+
+    async def _fetch_batch_chunk(
+        self, chunk_ids: List[int], include_geometry: bool
+    ) -> List[Union[WOFPlace, WOFPlaceWithGeometry]]:
+        """Fetch a single chunk of IDs with one IN query."""
+        # Build query for this chunk
+        query = self.queries.build_batch_query(chunk_ids, include_geometry)
+
+        # Get the engine
+        engine = self.session.get_async_engine()
+        if not engine:
+            raise RuntimeError(
+                "Not connected. Session manager must be connected first."
+            )
+
+        # Execute query
+        async with engine.connect() as conn:
+            result = await conn.execute(query)
+            rows = result.fetchall()
 
+        # Transform rows for this chunk
         places: List[Union[WOFPlace, WOFPlaceWithGeometry]] = []
+        for row in rows:
+            place: Union[WOFPlace, WOFPlaceWithGeometry]
+            if include_geometry and "geojson" in row._mapping:
+                place = self.transform_row_with_geometry(row)
+            else:
+                place = self.transform_row_to_place(row)
+            places.append(place)
+        return places
 
-        # Process in chunks if necessary
-        if len(place_ids) > CHUNK_SIZE:
-            for i in range(0, len(place_ids), CHUNK_SIZE):
-                chunk_ids = place_ids[i : i + CHUNK_SIZE]
+    async def execute_geometry_query(
+        self, place_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get geometries for multiple places without re-reading SPR rows.
 
-                # Build query for this chunk
-                query = self.queries.build_batch_query(chunk_ids, include_geometry)
+        Args:
+            place_ids: List of place IDs
 
-                # Get the engine
-                engine = self.session.get_async_engine()
-                if not engine:
-                    raise RuntimeError(
-                        "Not connected. Session manager must be connected first."
-                    )
+        Returns:
+            Mapping of place ID to parsed GeoJSON (missing IDs are omitted)
+        """
+        unique_ids = list(dict.fromkeys(place_ids))
+        if not unique_ids or self.queries.geojson_table is None:
+            return {}
+
+        chunks = await asyncio.gather(
+            *[
+                self._fetch_geometry_chunk(unique_ids[i : i + CHUNK_SIZE])
+                for i in range(0, len(unique_ids), CHUNK_SIZE)
+            ]
+        )
 
-                # Execute query
-                async with engine.connect() as conn:
-                    result = await conn.execute(query)
-                    rows = result.fetchall()
+        geometries: Dict[int, Dict[str, Any]] = {}
+        for chunk in chunks:
+            geometries.update(chunk)
+        return geometries
 
-                # Transform rows for this chunk
-                for row in rows:
-                    place: Union[WOFPlace, WOFPlaceWithGeometry]
-                    if include_geometry and "geojson" in row._mapping:
-                        place = self.transform_row_with_geometry(row)
-                    else:
-                        place = self.transform_row_to_place(row)
-                    places.append(place)
-        else:
-            # Original logic for small batches
-            # Build query
-            query = self.queries.build_batch_query(place_ids, include_geometry)
-
-            # Get the engine
-            engine = self.session.get_async_engine()
-            if not engine:
-                raise RuntimeError(
-                    "Not connected. Session manager must be connected first."
-                )
+    async def _fetch_geometry_chunk(
+        self, chunk_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Fetch geometries for a single chunk of IDs."""
+        query = self.queries.build_geometry_query(chunk_ids)
 
-            # Execute query
-            async with engine.connect() as conn:
-                result = await conn.execute(query)
-                rows = result.fetchall()
+        # Get the engine
+        engine = self.session.get_async_engine()
+        if not engine:
+            raise RuntimeError(
+                "Not connected. Session manager must be connected first."
+            )
 
-            # Transform rows
-            for row in rows:
-                current_place: Union[WOFPlace, WOFPlaceWithGeometry]
-                if include_geometry and "geojson" in row._mapping:
-                    current_place = self.transform_row_with_geometry(row)
-                else:
-                    current_place = self.transform_row_to_place(row)
-                places.append(current_place)
+        async with engine.connect() as conn:
+            result = await conn.execute(query)
+            rows = result.fetchall()
 
-        return places
+        geometries: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            if not row.geojson:
+                continue
+            try:
+                geometries[row.id] = json.loads(row.geojson)
+            except (json.JSONDecodeError, TypeError):
+                continue
+        return geometries
+
+    async def execute_geometry_ids_query(self, place_ids: List[int]) -> Set[int]:
+        """
+        Find which places have geometry without reading the GeoJSON.
+
+        Args:
+            place_ids: List of place IDs
+
+        Returns:
+            Set of the given IDs that have a primary geometry
+        """
+        unique_ids = list(dict.fromkeys(place_ids))
+        if not unique_ids or self.queries.geojson_table is None:
+            return set()
+
+        engine = self.session.get_async_engine()
+        if not engine:
+            raise RuntimeError(
+                "Not connected. Session manager must be connected first."
+            )
+
+        found: Set[int] = set()
+        async with engine.connect() as conn:
+            for i in range(0, len(unique_ids), CHUNK_SIZE):
+                query = self.queries.build_geometry_ids_query(
+                    unique_ids[i : i + CHUNK_SIZE]
+                )
+                result = await conn.execute(query)
+                found.update(row.id for row in result)
+        return found
 
     def transform_row_to_place(self, row: Row) -> WOFPlace:
         """
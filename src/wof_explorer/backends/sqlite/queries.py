@@ -6,7 +6,8 @@ Part of the SQLite backend refactoring following Infrastructure Subsystem Patter
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 
 from sqlalchemy import select, and_, or_, text, Table
 from sqlalchemy.sql import Select
@@ -16,6 +17,9 @@ from wof_explorer.models.places import BBox
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct search filter shapes whose rendered SQL is kept
+SEARCH_SQL_CACHE_SIZE = 256
+
 
 class SQLiteQueryBuilder:
     """Builds SQL queries for WOF data access."""
@@ -32,6 +36,10 @@ class SQLiteQueryBuilder:
         self.names_table: Optional[Table] = tables.get("names")
         self.ancestors_table: Optional[Table] = tables.get("ancestors")
         self.geojson_table: Optional[Table] = tables.get("geojson")
+        self.rtree_table: Optional[Table] = tables.get("rtree")
+
+        # Rendered search SQL keyed by filter shape (least recently used first)
+        self._search_sql: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
 
         # Validate that required tables are present
         if self.spr_table is None:
@@ -59,8 +67,12 @@ class SQLiteQueryBuilder:
             else:
                 query = query.where(self.spr_table.c.placetype == filters.placetype)
 
-        # Apply name filter (search in both main name and alternative names)
-        if filters.name:
+        # Apply name filter
+        if filters.name and isinstance(filters.name, list):
+            # Exact match on any of the names, in one IN query
+            query = query.where(self.spr_table.c.name.in_(filters.name))
+        elif filters.name:
+            # Search in both main name and alternative names
             name_pattern = f"%{filters.name}%"
             name_conditions = [self.spr_table.c.name.ilike(name_pattern)]
 
@@ -201,6 +213,49 @@ class SQLiteQueryBuilder:
 
         return query
 
+    def render_search_query(self, filters: WOFSearchFilters, query: Select) -> str:
+        """
+        Render the SQL text of a search query, cached by filter shape.
+
+        Filter values are bound parameters, so searches that set the same
+        filters with different values (e.g. one query per region) produce the
+        same SQL. Rendering it once per shape avoids recompiling the statement
+        to text on every search; execution itself already goes through
+        SQLAlchemy's compiled cache.
+
+        Args:
+            filters: Filters the query was built from
+            query: Query returned by build_search_query(filters)
+
+        Returns:
+            SQL text with bound parameter placeholders
+        """
+        key = self.search_shape(filters)
+        sql = self._search_sql.get(key)
+        if sql is not None:
+            self._search_sql.move_to_end(key)
+            return sql
+
+        sql = self._search_sql[key] = str(query)
+        if len(self._search_sql) > SEARCH_SQL_CACHE_SIZE:
+            self._search_sql.popitem(last=False)
+        return sql
+
+    @staticmethod
+    def search_shape(filters: WOFSearchFilters) -> Tuple[Any, ...]:
+        """
+        Describe which filters are set, ignoring their values.
+
+        Two filters with the same shape build structurally identical queries.
+        Empty and falsy values are kept distinct from truthy ones, since the
+        builder skips some of them.
+        """
+        return tuple(
+            (field, type(value).__name__, bool(value))
+            for field, value in filters.__dict__.items()
+            if value is not None
+        )
+
     def build_hierarchy_query(
         self, place_id: int, direction: str = "children"
     ) -> Select:
@@ -298,6 +353,61 @@ class SQLiteQueryBuilder:
 
         return query
 
+    def build_geometry_query(self, ids: List[int]) -> Select:
+        """
+        Build geometry-only retrieval query.
+
+        Reads just the geojson table (primary geometries, not alt-geometries)
+        for callers that already hold the SPR attributes.
+
+        Args:
+            ids: List of place IDs
+
+        Returns:
+            SQLAlchemy Select query yielding (id, geojson) rows
+        """
+        if self.geojson_table is None:
+            raise RuntimeError("GeoJSON table not initialized - call connect() first")
+
+        query = select(
+            self.geojson_table.c.id, self.geojson_table.c.body.label("geojson")
+        ).where(self.geojson_table.c.id.in_(ids))
+
+        if hasattr(self.geojson_table.c, "is_alt"):
+            is_alt = self.geojson_table.c.is_alt
+            query = query.where(or_(is_alt.is_(None), is_alt == 0))
+
+        return query
+
+    def build_geometry_ids_query(self, ids: List[int]) -> Select:
+        """
+        Build a query for which IDs have a primary geometry.
+
+        Only tests that a GeoJSON body exists, so the body itself is never
+        read back or decoded.
+
+        Args:
+            ids: List of place IDs
+
+        Returns:
+            SQLAlchemy Select query yielding distinct id rows
+        """
+        if self.geojson_table is None:
+            raise RuntimeError("GeoJSON table not initialized - call connect() first")
+
+        body = self.geojson_table.c.body
+        query = (
+            select(self.geojson_table.c.id)
+            .distinct()
+            .where(self.geojson_table.c.id.in_(ids), body.isnot(None), body != "")
+        )
+
+        if hasattr(self.geojson_table.c, "is_alt"):
+            is_alt = self.geojson_table.c.is_alt
+            query = query.where(or_(is_alt.is_(None), is_alt == 0))
+
+        return query
+
     def apply_filters(
         self, query: Select, table: Optional[Table], filters: WOFFilters
     ) -> Select:
@@ -410,7 +520,7 @@ class SQLiteQueryBuilder:
         if self.spr_table is None:
             raise RuntimeError("SPR table not initialized - call connect() first")
         min_lon, min_lat, max_lon, max_lat = bbox
-        return query.where(
+        query = query.where(
             and_(
                 self.spr_table.c.latitude >= min_lat,
                 self.spr_table.c.latitude <= max_lat,
@@ -419,6 +529,32 @@ class SQLiteQueryBuilder:
             )
         )
 
+        # When the database ships an R*Tree index, use it to narrow candidates
+        # to places whose bounding box intersects the query box; the centroid
+        # test above still decides membership. The index only holds polygon
+        # geometries, so places without a row in it are always kept
+        if self.rtree_table is not None:
+            rtree = self.rtree_table.c
+            place_id = rtree.wof_id if "wof_id" in rtree else rtree.id
+            candidates = select(place_id).where(
+                and_(
+                    rtree.min_x <= max_lon,
+                    rtree.max_x >= min_lon,
+                    rtree.min_y <= max_lat,
+                    rtree.max_y >= min_lat,
+                )
+            )
+            query = query.where(
+                or_(
+                    self.spr_table.c.id.in_(candidates),
+                    self.spr_table.c.id.not_in(
+                        select(place_id).where(place_id.is_not(None))
+                    ),
+                )
+            )
+
+        return query
+
     def _apply_proximity_filter(
         self, query: Select, proximity: Dict[str, Any]
     ) -> Select:
@@ -6,15 +6,40 @@ Part of the SQLite backend refactoring following Infrastructure Subsystem Patter
 """
 
 import logging
+import os
 from typing import Optional, Dict, Any
 from pathlib import Path
 
-from sqlalchemy import create_engine, Table
+from sqlalchemy import create_engine, event, Table
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning applied to every pooled read connection.
+# WOF databases are opened read-only, so write-side settings such as
+# journal_mode/synchronous are deliberately left to the file's defaults.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "cache_size": -64000,  # ~64 MB page cache per connection
+    "temp_store": "MEMORY",  # sorts/temp b-trees stay off disk
+    "mmap_size": 256 << 20,  # read pages straight from the OS page cache
+    "query_only": 1,  # connector never writes; guard the source files
+}
+
+# Number of persistent reader connections. SQLite allows any number of
+# concurrent readers, so gathered queries run in parallel worker threads.
+READ_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+
+def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
 
 class SQLiteSessionManager:
     """Manages SQLite database session and connection."""
@@ -54,17 +79,23 @@ class SQLiteSessionManager:
         # Create connection URL for async SQLite
         url = f"sqlite+aiosqlite:///{self.db_path}"
 
-        # Create async engine with optimized settings
+        # Create async engine with a pool of reader connections. Pre-ping is
+        # skipped: a local file connection cannot go stale, and the extra
+        # SELECT 1 would cost a worker-thread round-trip on every checkout.
         self._async_engine = create_async_engine(
             url,
             echo=False,
-            pool_pre_ping=True,
+            pool_size=READ_POOL_SIZE,
             connect_args={
                 "isolation_level": None,  # autocommit mode
                 "check_same_thread": False,
             },
         )
 
+        # Connections are pooled and reused across queries, so the page cache
+        # configured here stays warm for the lifetime of the connector
+        event.listen(self._async_engine.sync_engine, "connect", _apply_pragmas)
+
         self._connected = True
         logger.info(f"Connected to database: {self.db_path.name}")
 
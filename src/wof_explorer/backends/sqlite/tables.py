@@ -4,7 +4,7 @@ These are reflected from the existing database schema.
 """
 
 from typing import Dict
-from sqlalchemy import MetaData, Table, Engine
+from sqlalchemy import MetaData, Table, Engine, inspect
 
 metadata = MetaData()
 
@@ -35,6 +35,17 @@ def get_tables(engine: Engine) -> Dict[str, Table]:
             raise ValueError(f"Required table '{table_name}' not found in database")
         tables[table_name] = table
 
+    # Optional tables - only present in some WOF distributions. Check the
+    # database itself, since the shared metadata may hold tables reflected
+    # from another file.
+    optional_tables = ["rtree"]
+    available = set(inspect(engine).get_table_names())
+
+    for table_name in optional_tables:
+        table = metadata.tables.get(table_name)
+        if table is not None and table_name in available:
+            tables[table_name] = table
+
     return tables
 
 
@@ -97,4 +108,14 @@ Concordances Table:
     - other_id: TEXT
     - other_source: TEXT
     - lastmodified: INTEGER
+
+RTree Table (optional, R*Tree virtual table of geometry bounding boxes):
+    - id: INTEGER (rtree row id)
+    - min_x, max_x: REAL (longitude bounds)
+    - min_y, max_y: REAL (latitude bounds)
+    - wof_id: INTEGER (place id, auxiliary column)
+    - is_alt: TINYINT
+    - alt_label: TEXT
+    - geometry: BLOB
+    - lastmodified: INTEGER
 """
@@ -6,7 +6,7 @@ Part of the Infrastructure Subsystems Pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Set, Union
 from pathlib import Path
 import warnings
 
@@ -165,6 +165,41 @@ class WOFConnectorBase(ABC):
                 places.append(place)
         return places
 
+    async def get_geometries(self, place_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get geometry for multiple places without re-reading their attributes.
+
+        Default implementation extracts geometry from get_places.
+        Backends can override to read only the geometry store.
+
+        Args:
+            place_ids: List of WhosOnFirst place IDs
+
+        Returns:
+            Mapping of place ID to GeoJSON (places without geometry are omitted)
+        """
+        places = await self.get_places(place_ids, include_geometry=True)
+        return {
+            p.id: p.geometry
+            for p in places
+            if isinstance(p, WOFPlaceWithGeometry) and p.geometry is not None
+        }
+
+    async def get_geometry_ids(self, place_ids: List[int]) -> Set[int]:
+        """
+        Find which places have geometry, without loading it.
+
+        Default implementation checks the result of get_geometries.
+        Backends can override with an existence-only query.
+
+        Args:
+            place_ids: List of WhosOnFirst place IDs
+
+        Returns:
+            Set of the given IDs that have geometry
+        """
+        return set(await self.get_geometries(place_ids))
+
     # ============= HIERARCHY OPERATIONS =============
 
     @abstractmethod
@@ -202,6 +237,26 @@ class WOFConnectorBase(ABC):
         """
         pass
 
+    async def get_ancestors_batch(
+        self, place_ids: List[int]
+    ) -> Dict[int, List[WOFAncestor]]:
+        """
+        Get ancestors for multiple places.
+
+        Default implementation calls get_ancestors for each ID.
+        Backends can override for batch optimization.
+
+        Args:
+            place_ids: List of place IDs
+
+        Returns:
+            Mapping of place ID to its ancestors (parent to root)
+        """
+        return {
+            place_id: await self.get_ancestors(place_id)
+            for place_id in dict.fromkeys(place_ids)
+        }
+
     async def get_descendants(
         self, ancestor_id: int, filters: Optional[WOFFilters] = None
     ) -> List[WOFPlace]:
@@ -5,7 +5,8 @@ Provides flexible table formatting for search results, summaries,
 and comparisons.
 """
 
-from typing import List, Dict, Any, Optional
+from itertools import zip_longest
+from typing import List, Dict, Any, Iterable, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -112,10 +113,15 @@ class TableDisplay:
             if i < len(self.column_widths):
                 self.column_widths[i] = max(self.column_widths[i], len(val))
 
-    def add_rows(self, rows: List[List[Any]]) -> None:
-        """Add multiple rows."""
-        for row in rows:
-            self.add_row(row)
+    def add_rows(self, rows: Iterable[List[Any]]) -> None:
+        """Add multiple rows, updating column widths once per column."""
+        str_rows = [[str(v) if v is not None else "" for v in row] for row in rows]
+        self.rows.extend(str_rows)
+
+        # Update column widths
+        for i, column in enumerate(zip_longest(*str_rows, fillvalue="")):
+            if i < len(self.column_widths):
+                self.column_widths[i] = max(self.column_widths[i], *map(len, column))
 
     def render(self) -> str:
         """Render the table to string."""
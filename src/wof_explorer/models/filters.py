@@ -16,7 +16,10 @@ class WOFSearchFilters(BaseModel):
     """
 
     # Name search
-    name: Optional[str] = Field(default=None, description="Search in place names")
+    name: Optional[Union[str, List[str]]] = Field(
+        default=None,
+        description="Search in place names (a list matches any exact name)",
+    )
     name_exact: bool = Field(default=False, description="Exact match vs contains")
     name_language: str = Field(default="eng", description="Language for name search")
     name_type: Literal["preferred", "colloquial", "variant", "any"] = Field(
@@ -63,6 +63,11 @@ class WOFPlace(BaseModel):
         extra="allow",  # Allow extra fields from database
     )
 
+    @property
+    def area_sqkm(self) -> Optional[float]:
+        """Area in square kilometers, derived from area_m2."""
+        return self.area_m2 / 1_000_000 if self.area_m2 is not None else None
+
     @field_validator("placetype", mode="before")
     @classmethod
     def _coerce_placetype(cls, value):
@@ -3,10 +3,11 @@ Place collections with serialization capabilities.
 Provides a clean way to work with groups of places and export them to various formats.
 """
 
-from typing import ClassVar, List, Dict, Any, Optional, Tuple
+from typing import IO, ClassVar, List, Dict, Any, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 import random
 from collections import Counter
+from pathlib import Path
 
 from wof_explorer.models.places import WOFPlace
 from wof_explorer.types import PlaceType, PlacetypeLike, coerce_placetype
@@ -690,6 +691,7 @@ class PlaceCollection(BaseModel):
         use_polygons: bool = True,
         include_all_metadata: bool = False,
         require_geometry: bool = False,
+        quantize: bool = False,
     ) -> str:
         """
         Convert to GeoJSON string ready for pasting.
@@ -704,6 +706,9 @@ class PlaceCollection(BaseModel):
                          If False, always use point geometry (lat/lon only).
             include_all_metadata: If True, include all available place fields in properties.
                                  Overrides properties list if set.
+            quantize: If True, emit integer coordinates plus a top-level
+                     "transform" block (scale/translate). This is a
+                     non-standard extension that shrinks large polygon exports.
 
         Returns:
             JSON string of GeoJSON FeatureCollection
@@ -716,8 +721,98 @@ class PlaceCollection(BaseModel):
             use_polygons=use_polygons,
             include_all_metadata=include_all_metadata,
             require_geometry=require_geometry,
+            quantize=quantize,
         )
 
+    def estimated_geojson_bytes(self, require_geometry: bool = False) -> int:
+        """
+        Estimate the size of compact GeoJSON output without serializing.
+
+        Use this for size reporting; call ``to_geojson_string()`` only when
+        the text itself is needed.
+
+        Args:
+            require_geometry: Count only places that have geometry, matching
+                             the same option on ``to_geojson_string()``
+
+        Returns:
+            Approximate size in bytes
+        """
+        from .serializers import SerializerRegistry
+
+        serializer = SerializerRegistry.get("geojson")
+        return serializer.estimate_size(self.places, require_geometry=require_geometry)
+
+    def to_geojson_bytes(
+        self,
+        indent: Optional[int] = 2,
+        properties: Optional[List[str]] = None,
+        use_polygons: bool = True,
+        include_all_metadata: bool = False,
+        require_geometry: bool = False,
+        quantize: bool = False,
+    ) -> bytes:
+        """
+        Convert to UTF-8 encoded GeoJSON bytes, e.g. for ``Path.write_bytes``.
+
+        Takes the same options as ``to_geojson_string()``.
+        """
+        from .serializers import SerializerRegistry
+
+        serializer = SerializerRegistry.get("geojson")
+        return serializer.serialize_bytes(
+            self.places,
+            indent=indent,
+            pretty=indent is not None,
+            properties=properties,
+            use_polygons=use_polygons,
+            include_all_metadata=include_all_metadata,
+            require_geometry=require_geometry,
+            quantize=quantize,
+        )
+
+    def write_geojson(
+        self,
+        path_or_file: Union[str, Path, IO[str]],
+        indent: Optional[int] = 2,
+        properties: Optional[List[str]] = None,
+        use_polygons: bool = True,
+        include_all_metadata: bool = False,
+        require_geometry: bool = False,
+        quantize: bool = False,
+    ) -> None:
+        """
+        Stream GeoJSON to a file path or open text file, one feature at a time.
+
+        Produces the same document as ``to_geojson_string()`` without holding
+        the whole string in memory, which matters for large polygon exports.
+
+        Args:
+            path_or_file: Destination path, or an open text file-like object
+            indent: JSON indentation level (None for compact output)
+            properties: List of place attributes to include in feature properties.
+            use_polygons: If True, use polygon/multipolygon geometry when available.
+            include_all_metadata: If True, include all available place fields in properties.
+            require_geometry: If True, skip places without geometry.
+            quantize: If True, emit integer coordinates plus a "transform" block.
+        """
+        from .serializers import SerializerRegistry
+
+        serializer = SerializerRegistry.get("geojson")
+        options = {
+            "indent": indent,
+            "pretty": indent is not None,
+            "properties": properties,
+            "use_polygons": use_polygons,
+            "include_all_metadata": include_all_metadata,
+            "require_geometry": require_geometry,
+            "quantize": quantize,
+        }
+        if hasattr(path_or_file, "write"):
+            serializer.write(self.places, path_or_file, **options)
+        else:
+            serializer.save(self.places, Path(path_or_file), **options)
+
     def to_csv_rows(self) -> List[Dict[str, Any]]:
         """
         Convert collection to CSV-friendly rows.
@@ -730,6 +825,22 @@ class PlaceCollection(BaseModel):
         serializer = SerializerRegistry.get("csv")
         return serializer.serialize_to_dict(self.places)
 
+    def to_csv_string(self, columns: Optional[List[str]] = None) -> str:
+        """
+        Convert collection to CSV text.
+
+        Args:
+            columns: Columns to include (default: the CSV serializer's columns)
+
+        Returns:
+            CSV text with a header row (empty string for an empty collection)
+        """
+        from .serializers import SerializerRegistry
+
+        serializer = SerializerRegistry.get("csv")
+        options = {"columns": columns} if columns else {}
+        return serializer.serialize(self.places, **options)
+
     def to_wkt_list(self) -> List[Dict[str, Any]]:
         """
         Convert to Well-Known Text format for GIS tools.
@@ -860,10 +971,13 @@ class PlaceCollection(BaseModel):
         if not self.places:
             return self
 
-        # Batch fetch ancestors for all places
+        # Batch fetch ancestors for all places in one round-trip
+        ancestors_by_place = await connector.get_ancestors_batch(
+            [p.id for p in self.places]
+        )
         ancestor_data = {}
         for place in self.places:
-            ancestors = await connector.get_ancestors(place.id)
+            ancestors = ancestors_by_place.get(place.id, [])
             ancestor_data[place.id] = [
                 {
                     "id": a.id,
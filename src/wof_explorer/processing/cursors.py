@@ -3,7 +3,8 @@ Cursor implementations for WOF connector.
 Cursors provide lazy-loading access to search results and hierarchical data.
 """
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING, ClassVar
+import asyncio
+from typing import AsyncIterator, List, Optional, Dict, Any, TYPE_CHECKING, ClassVar
 
 from wof_explorer.models.places import WOFPlace, WOFPlaceWithGeometry
 from wof_explorer.models.hierarchy import WOFAncestor
@@ -91,8 +92,11 @@ class WOFSearchCursor:
         if not self.places:
             return PlaceCollection(places=[], metadata={"source": "cursor"})
 
-        place_ids = [p.id for p in self.places]
-        places = await self._connector.get_places(place_ids, include_geometry)
+        if include_geometry:
+            places = await self._attach_geometry(self.places)
+        else:
+            place_ids = [p.id for p in self.places]
+            places = await self._connector.get_places(place_ids)
 
         return PlaceCollection.from_places(
             places,
@@ -146,8 +150,11 @@ class WOFSearchCursor:
             return PlaceCollection(places=[], metadata={"page": page, "size": size})
 
         # Fetch full details for the page
-        place_ids = [p.id for p in page_places]
-        places = await self._connector.get_places(place_ids, include_geometry)
+        if include_geometry:
+            places = await self._attach_geometry(page_places)
+        else:
+            place_ids = [p.id for p in page_places]
+            places = await self._connector.get_places(place_ids)
 
         return PlaceCollection.from_places(
             places,
@@ -159,6 +166,46 @@ class WOFSearchCursor:
             fetched_with_geometry=include_geometry,
         )
 
+    async def iter_chunks(
+        self, chunk_size: int = 100, include_geometry: bool = False
+    ) -> AsyncIterator[List[WOFPlace]]:
+        """
+        Stream full place details in chunks instead of fetching them all.
+
+        Each chunk is fetched only when the consumer asks for it, so peak
+        memory is bounded by ``chunk_size`` (which matters most when
+        geometries are included) and the first chunk is available without
+        waiting for the whole result set.
+
+        Args:
+            chunk_size: Number of places per chunk
+            include_geometry: Whether to include GeoJSON geometry
+
+        Yields:
+            Lists of places with full details, in cursor order
+        """
+        for i in range(0, len(self.places), chunk_size):
+            chunk = self.places[i : i + chunk_size]
+            if include_geometry:
+                yield await self._attach_geometry(chunk)
+            else:
+                yield await self._connector.get_places([p.id for p in chunk])
+
+    async def _attach_geometry(
+        self, places: List[WOFPlace]
+    ) -> List[WOFPlaceWithGeometry]:
+        """
+        Merge geometry into places the search already returned.
+
+        The search rows already carry the SPR attributes, so only the
+        geometry is read back rather than re-fetching each place in full.
+        """
+        geometries = await self._connector.get_geometries([p.id for p in places])
+        return [
+            WOFPlaceWithGeometry(**p.model_dump(), geometry=geometries.get(p.id))
+            for p in places
+        ]
+
     async def fetch_geometries(self) -> List[WOFPlaceWithGeometry]:
         """
         Fetch all places with their geometries.
@@ -456,6 +503,7 @@ class WOFHierarchyCursor:
         self._root = root_place
         self._connector = connector
         self._ancestors_cache: Optional[List[WOFAncestor]] = None
+        self._ancestors_task: Optional["asyncio.Future[List[WOFAncestor]]"] = None
         self._descendants_cache: Optional[List[WOFPlace]] = None
 
     @property
@@ -473,18 +521,43 @@ class WOFHierarchyCursor:
         Returns:
             List of ancestor places
         """
-        if self._ancestors_cache is None:
-            self._ancestors_cache = await self._connector.get_ancestors(self._root.id)
+        ancestors = await self._load_ancestors()
+        ancestor_ids = [a.id for a in ancestors]
 
         if include_geometry:
             # Fetch full details with geometry
-            ancestor_ids = [a.id for a in self._ancestors_cache]
             return await self._connector.get_places(ancestor_ids, include_geometry=True)
 
         # Convert ancestors to places without geometry
-        ancestor_ids = [a.id for a in self._ancestors_cache]
         return await self._connector.get_places(ancestor_ids, include_geometry=False)
 
+    async def _load_ancestors(self) -> List[WOFAncestor]:
+        """
+        Look up the root's ancestor chain once.
+
+        The lookup is memoized as a shared future, so concurrent callers
+        (e.g. fetch_ancestors and fetch_siblings under asyncio.gather) wait
+        on the same query instead of each issuing their own.
+        """
+        if self._ancestors_cache is not None:
+            return self._ancestors_cache
+
+        if self._ancestors_task is None:
+            self._ancestors_task = asyncio.ensure_future(
+                self._connector.get_ancestors(self._root.id)
+            )
+
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared lookup
+            ancestors = await asyncio.shield(self._ancestors_task)
+        except Exception:
+            # Let the next call retry rather than replaying the failure
+            self._ancestors_task = None
+            raise
+
+        self._ancestors_cache = ancestors
+        return ancestors
+
     async def fetch_descendants(
         self, filters: Optional[WOFFilters] = None, include_geometry: bool = False
     ) -> List[WOFPlace]:
@@ -537,7 +610,7 @@ class WOFHierarchyCursor:
             List of sibling places
         """
         # Get the parent
-        ancestors = await self.fetch_ancestors()
+        ancestors = await self._load_ancestors()
         if not ancestors:
             return []
 
@@ -574,10 +647,10 @@ class WOFHierarchyCursor:
         Returns:
             Dictionary representation of the hierarchy
         """
-        ancestors = await self.fetch_ancestors()
-
         filters = WOFFilters(max_depth=max_depth) if max_depth else None
-        descendants = await self.fetch_descendants(filters)
+        ancestors, descendants = await asyncio.gather(
+            self.fetch_ancestors(), self.fetch_descendants(filters)
+        )
 
         return {
             "root": self._root.model_dump(),
@@ -626,11 +699,14 @@ class WOFBatchCursor:
         """
         Fetch all places in the batch.
 
+        The connector resolves the IDs with batched IN queries, so this is a
+        single round-trip for typical batch sizes.
+
         Args:
             include_geometry: Whether to include geometries
 
         Returns:
-            List of places with full details
+            List of places with full details, in the order of ``place_ids``
         """
         if self._places_cache is None or include_geometry:
             self._places_cache = await self._connector.get_places(
@@ -646,9 +722,10 @@ class WOFBatchCursor:
             List of hierarchy data for each place
         """
         hierarchies = []
+        ancestors_by_place = await self._connector.get_ancestors_batch(self._place_ids)
 
         for place_id in self._place_ids:
-            ancestors = await self._connector.get_ancestors(place_id)
+            ancestors = ancestors_by_place.get(place_id, [])
             hierarchies.append(
                 {"place_id": place_id, "ancestors": [a.model_dump() for a in ancestors]}
             )
@@ -16,6 +16,7 @@ from __future__ import annotations
 from typing import Dict, Iterable, List, Optional
 
 from wof_explorer.models.filters import WOFSearchFilters, WOFFilters
+from wof_explorer.models.places import WOFPlace
 from wof_explorer.processing.collections import PlaceCollection
 from wof_explorer.types import PlaceType
 
@@ -58,11 +59,26 @@ async def _find_locality(
 
 async def _collect_localities(connector, names: Iterable[str]) -> PlaceCollection:
     """Fetch full locality places (with geometry) for given names."""
+    names = list(names)
+
+    # Look up every name with one exact-match IN query; only names without
+    # an exact match fall back to a per-name fuzzy search
+    cursor = await connector.search(
+        WOFSearchFilters(name=names, placetype=PlaceType.LOCALITY, is_current=True)
+    )
+    exact: Dict[str, List[WOFPlace]] = {}
+    for place in cursor.places:
+        exact.setdefault(place.name, []).append(place)
+
     ids: List[int] = []
     for n in names:
         # Country hint: Toronto likely CA, others US; keep it simple
         country = "CA" if n.lower() == "toronto" else None
-        place_id = await _find_locality(connector, n, country)
+        matches = [p for p in exact.get(n, []) if not country or p.country == country]
+        if matches:
+            place_id: Optional[int] = matches[0].id
+        else:
+            place_id = await _find_locality(connector, n, country)
         if place_id:
             ids.append(place_id)
 
@@ -13,6 +13,9 @@ from wof_explorer.models.places import WOFPlace
 from wof_explorer.processing.serializers.base import SerializerBase, SerializerRegistry
 
 
+_BBOX_COLUMNS = frozenset({"min_lat", "min_lon", "max_lat", "max_lon"})
+
+
 class CSVSerializer(SerializerBase):
     """Serializes WOF places to CSV format."""
 
@@ -44,8 +47,13 @@ class CSVSerializer(SerializerBase):
 
     def _place_to_row(self, place: WOFPlace, columns: List[str]) -> Dict[str, Any]:
         row: Dict[str, Any] = {}
+        bounds_done = False
         for col in columns:
-            if col in {"min_lat", "min_lon", "max_lat", "max_lon"}:
+            if col in _BBOX_COLUMNS:
+                # Any bbox column emits all four, computed once per place
+                if bounds_done:
+                    continue
+                bounds_done = True
                 bbox = place.get_bounds()
                 if bbox:
                     row["min_lat"] = bbox.min_lat
@@ -53,10 +61,10 @@ class CSVSerializer(SerializerBase):
                     row["max_lat"] = bbox.max_lat
                     row["max_lon"] = bbox.max_lon
                 else:
-                    row.setdefault("min_lat", None)
-                    row.setdefault("min_lon", None)
-                    row.setdefault("max_lat", None)
-                    row.setdefault("max_lon", None)
+                    row["min_lat"] = None
+                    row["min_lon"] = None
+                    row["max_lat"] = None
+                    row["max_lon"] = None
             elif hasattr(place, col):
                 row[col] = getattr(place, col)
             elif col == "lat":
@@ -68,22 +76,20 @@ class CSVSerializer(SerializerBase):
         return row
 
     def serialize(self, places: List[WOFPlace], **options) -> str:
-        rows = self.serialize_to_dict(places, **options)
-        if not rows:
-            return ""
         output = StringIO()
-        writer = _csv.DictWriter(output, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
+        self.write(places, output, **options)
         return output.getvalue()
 
     def write(self, places: List[WOFPlace], file, **options) -> None:
         rows = self.serialize_to_dict(places, **options)
         if not rows:
             return
-        writer = _csv.DictWriter(file, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
+        # Every row is built from the same column list, so the keys line up
+        # and rows can go straight to csv.writer without DictWriter's
+        # per-row field checks
+        writer = _csv.writer(file)
+        writer.writerow(rows[0].keys())
+        writer.writerows(row.values() for row in rows)
 
 
 # Self-register on import
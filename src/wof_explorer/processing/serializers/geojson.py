@@ -5,12 +5,80 @@ Builds Feature and FeatureCollection objects.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterator, List, Dict, Any, Optional, Union
 import json
 
 from wof_explorer.models.places import WOFPlace, WOFPlaceWithGeometry
 from wof_explorer.processing.serializers.base import SerializerBase, SerializerRegistry
 
+# Placeholder spliced out of indented feature JSON and replaced with the
+# compactly encoded coordinate array (see GeoJSONSerializer.iter_encode)
+_COORDINATES_TOKEN = "\x00coordinates\x00"
+_COORDINATES_TOKEN_JSON = json.dumps(_COORDINATES_TOKEN)
+
+
+# Grid size used by the ``quantize`` option (~1cm at the equator)
+QUANTIZE_SCALE = 1e-7
+
+# Rough compact-output sizes used by estimate_size: the feature wrapper plus
+# the default properties, and one "[lon,lat]," position at typical WOF precision
+_FEATURE_BYTES_ESTIMATE = 400
+_POSITION_BYTES_ESTIMATE = 28
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON serializer for objects not serializable by default."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _dumps(obj: Any, indent: Optional[str] = None) -> str:
+    """Encode to JSON text with the stdlib encoder."""
+    return json.dumps(obj, indent=indent, default=_json_default)
+
+
+def _iter_positions(geometry: Dict[str, Any]) -> Iterator[List[float]]:
+    """Yield every position in a geometry, including GeometryCollections."""
+    for member in geometry.get("geometries") or ():
+        if isinstance(member, dict):
+            yield from _iter_positions(member)
+
+    stack = [geometry.get("coordinates")]
+    while stack:
+        coords = stack.pop()
+        if not coords:
+            continue
+        if isinstance(coords[0], (int, float)):
+            yield coords
+        else:
+            stack.extend(coords)
+
+
+def _quantize_coordinates(coords: Any, tx: float, ty: float, k: float) -> Any:
+    """Map positions onto the integer grid described by a transform block."""
+    if coords and isinstance(coords[0], (int, float)):
+        return [round((coords[0] - tx) * k), round((coords[1] - ty) * k), *coords[2:]]
+    return [_quantize_coordinates(c, tx, ty, k) for c in coords]
+
+
+def _quantize_geometry(geometry: Dict[str, Any], transform: Dict[str, Any]) -> Dict:
+    """Return a copy of a geometry with quantized integer coordinates."""
+    tx, ty = transform["translate"]
+    k = 1 / transform["scale"][0]
+    result = dict(geometry)
+    if "coordinates" in geometry:
+        result["coordinates"] = _quantize_coordinates(
+            geometry["coordinates"], tx, ty, k
+        )
+    if "geometries" in geometry:
+        result["geometries"] = [
+            _quantize_geometry(g, transform) for g in geometry["geometries"]
+        ]
+    return result
+
 
 class GeoJSONSerializer(SerializerBase):
     """Serializes WOF places to GeoJSON format."""
@@ -27,16 +95,18 @@ class GeoJSONSerializer(SerializerBase):
         ]
 
     def serialize_to_dict(self, places: List[WOFPlace], **options) -> Dict[str, Any]:
+        transform = self._resolve_transform(places, **options)
+
         features = []
         for place in places:
-            feature = self._place_to_feature(place, **options)
+            feature = self._place_to_feature(place, transform=transform, **options)
             if feature is not None:
                 features.append(feature)
 
-        result: Dict[str, Any] = {
-            "type": "FeatureCollection",
-            "features": features,
-        }
+        result: Dict[str, Any] = {"type": "FeatureCollection"}
+        if transform:
+            result["transform"] = transform
+        result["features"] = features
 
         # Optionally add bbox to FeatureCollection (this is valid per GeoJSON spec)
         if options.get("include_collection_bbox", False):
@@ -47,21 +117,131 @@ class GeoJSONSerializer(SerializerBase):
         return result
 
     def serialize(self, places: List[WOFPlace], **options) -> str:
-        data = self.serialize_to_dict(places, **options)
+        # Features are encoded individually and joined, rather than building
+        # the full FeatureCollection dict and encoding it in one go
+        return "".join(self.iter_encode(places, **options))
+
+    def serialize_bytes(self, places: List[WOFPlace], **options) -> bytes:
+        """Serialize places to UTF-8 encoded GeoJSON bytes."""
+        return self.serialize(places, **options).encode("utf-8")
+
+    def iter_encode(self, places: List[WOFPlace], **options) -> Iterator[str]:
+        """
+        Yield the FeatureCollection as JSON text, one feature at a time.
+
+        Only a single feature is ever materialized, so large collections can
+        be streamed to disk without building the whole document in memory.
+
+        When indenting, geometry coordinate arrays are kept on a single line.
+        The stdlib encoder only uses its C implementation for unindented
+        output, so this keeps the (potentially huge) vertex lists on the fast
+        path and stops every number from landing on its own line.
+        """
         indent = options.get("indent", 2 if options.get("pretty", True) else None)
+        if isinstance(indent, int):
+            indent = " " * indent
+
+        def encode(obj: Any, depth: int) -> str:
+            text = _dumps(obj, indent)
+            if indent and depth:
+                text = text.replace("\n", "\n" + indent * depth)
+            return text
+
+        def encode_feature(feature: Dict[str, Any]) -> str:
+            geometry = feature.get("geometry")
+            if indent is None or not isinstance(geometry, dict):
+                return encode(feature, 2)
+            coordinates = geometry.get("coordinates")
+            if coordinates is None:
+                return encode(feature, 2)
+            skeleton = {
+                **feature,
+                "geometry": {**geometry, "coordinates": _COORDINATES_TOKEN},
+            }
+            return encode(skeleton, 2).replace(
+                _COORDINATES_TOKEN_JSON, _dumps(coordinates), 1
+            )
+
+        bbox = None
+        if options.get("include_collection_bbox", False):
+            bbox = self._calculate_bounds(places)
 
-        # Custom JSON encoder to handle datetime objects
-        from datetime import datetime
+        if indent is None:
+            open_features, item_sep, close_features = "[", ", ", "]"
+            head, key_sep, tail = "{", ", ", "}"
+        else:
+            item_pad = "\n" + indent * 2
+            open_features = "[" + item_pad
+            item_sep = "," + item_pad
+            close_features = "\n" + indent + "]"
+            head, key_sep, tail = "{\n" + indent, ",\n" + indent, "\n}"
 
-        def json_serial(obj):
-            """JSON serializer for objects not serializable by default."""
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        transform = self._resolve_transform(places, **options)
 
-        return json.dumps(data, indent=indent, default=json_serial)
+        yield head + '"type": "FeatureCollection"' + key_sep
+        if transform:
+            yield '"transform": ' + encode(transform, 1) + key_sep
+        yield '"features": '
 
-    def _place_to_feature(self, place: WOFPlace, **options) -> Optional[Dict[str, Any]]:
+        first = True
+        for place in places:
+            feature = self._place_to_feature(place, transform=transform, **options)
+            if feature is None:
+                continue
+            yield (open_features if first else item_sep) + encode_feature(feature)
+            first = False
+        yield "[]" if first else close_features
+
+        if bbox:
+            yield key_sep + '"bbox": ' + encode(bbox, 1)
+        yield tail
+
+    def write(self, places: List[WOFPlace], file: IO[str], **options) -> None:
+        """Stream the FeatureCollection to an open text file feature by feature."""
+        for chunk in self.iter_encode(places, **options):
+            file.write(chunk)
+
+    def save(self, places: List[WOFPlace], path: Union[Path, str], **options) -> None:
+        """Stream the FeatureCollection to a file path."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(p, "w", encoding="utf-8", buffering=1 << 20) as f:
+            self.write(places, f, **options)
+
+    def estimate_size(self, places: List[WOFPlace], **options) -> int:
+        """
+        Estimate the compact serialized size in bytes without encoding.
+
+        Counts features and geometry vertices instead of producing the JSON,
+        so it is cheap enough for size checks on large collections. Indented
+        output is larger; quantized output is smaller.
+        """
+        require_geometry = options.get("require_geometry", True)
+
+        total = 64  # FeatureCollection wrapper and bbox
+        for place in places:
+            geometry = None
+            if isinstance(place, WOFPlaceWithGeometry):
+                geometry = self._extract_geometry(place)
+            if geometry is None:
+                if require_geometry:
+                    continue
+                positions = 0
+            else:
+                positions = sum(1 for _ in _iter_positions(geometry))
+            total += (
+                _FEATURE_BYTES_ESTIMATE
+                + len(place.name)
+                + positions * _POSITION_BYTES_ESTIMATE
+            )
+        return total
+
+    def _place_to_feature(
+        self,
+        place: WOFPlace,
+        transform: Optional[Dict[str, Any]] = None,
+        **options,
+    ) -> Optional[Dict[str, Any]]:
         require_geometry = options.get("require_geometry", True)
 
         geometry = None
@@ -71,6 +251,9 @@ class GeoJSONSerializer(SerializerBase):
         if require_geometry and geometry is None:
             return None
 
+        if transform and geometry is not None:
+            geometry = _quantize_geometry(geometry, transform)
+
         properties = self._extract_properties(place, **options)
         return {
             "type": "Feature",
@@ -117,6 +300,42 @@ class GeoJSONSerializer(SerializerBase):
             return geom.get("geometry")
         return geom if isinstance(geom, dict) else None
 
+    def _resolve_transform(
+        self, places: List[WOFPlace], **options
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the TopoJSON-style transform block for the ``quantize`` option.
+
+        Quantized output stores integer offsets from the minimum vertex on a
+        QUANTIZE_SCALE grid; consumers recover positions with
+        ``x * scale[0] + translate[0]``. This is a non-standard extension
+        to GeoJSON, so it is only used when explicitly requested.
+        """
+        if not options.get("quantize", False):
+            return None
+
+        min_x = min_y = None
+        for place in places:
+            if not isinstance(place, WOFPlaceWithGeometry):
+                continue
+            geometry = self._extract_geometry(place)
+            if geometry is None:
+                continue
+            for position in _iter_positions(geometry):
+                x, y = position[0], position[1]
+                if min_x is None or x < min_x:
+                    min_x = x
+                if min_y is None or y < min_y:
+                    min_y = y
+
+        if min_x is None or min_y is None:
+            return None
+
+        return {
+            "scale": [QUANTIZE_SCALE, QUANTIZE_SCALE],
+            "translate": [min_x, min_y],
+        }
+
     def _calculate_bounds(self, places: List[WOFPlace]) -> Optional[List[float]]:
         if not places:
             return None
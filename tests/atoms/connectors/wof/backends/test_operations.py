@@ -0,0 +1,412 @@
+"""
+Unit tests for SQLiteOperations.
+
+These run against a tiny synthetic database that mirrors the WhosOnFirst
+SQLite schema, so they do not need the Barbados download.
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+import pytest_asyncio
+
+from wof_explorer.backends.sqlite import SQLiteWOFConnector as WOFConnector
+
+
+# ============= TEST FIXTURES =============
+
+SCHEMA = """
+CREATE TABLE spr (
+    id INTEGER NOT NULL PRIMARY KEY, parent_id INTEGER, name TEXT,
+    placetype TEXT, inception TEXT, cessation TEXT, country TEXT, repo TEXT,
+    latitude NUMERIC, longitude NUMERIC, min_latitude NUMERIC,
+    min_longitude NUMERIC, max_latitude NUMERIC, max_longitude NUMERIC,
+    is_current INTEGER, is_deprecated INTEGER, is_ceased INTEGER,
+    is_superseded INTEGER, is_superseding INTEGER, superseded_by TEXT,
+    supersedes TEXT, belongsto TEXT, is_alt TINYINT, alt_label TEXT,
+    lastmodified INTEGER
+);
+CREATE TABLE ancestors (
+    id INTEGER NOT NULL, ancestor_id INTEGER NOT NULL,
+    ancestor_placetype TEXT, lastmodified INTEGER
+);
+CREATE TABLE names (
+    id INTEGER NOT NULL, placetype TEXT, country TEXT, language TEXT,
+    extlang TEXT, script TEXT, region TEXT, variant TEXT, extension TEXT,
+    privateuse TEXT, name TEXT, lastmodified INTEGER
+);
+CREATE TABLE geojson (
+    id INTEGER NOT NULL, body TEXT, source TEXT, is_alt BOOLEAN,
+    alt_label TEXT, lastmodified INTEGER
+);
+CREATE TABLE concordances (
+    id INTEGER NOT NULL, other_id INTEGER NOT NULL, other_source TEXT,
+    lastmodified INTEGER
+);
+"""
+
+# (id, parent_id, name, placetype, latitude, longitude, ancestors)
+PLACES = [
+    (1, -1, "Testland", "country", 13.0, -59.5, []),
+    (2, 1, "Test Region", "region", 13.1, -59.6, [(1, "country")]),
+    (3, 2, "Test City", "locality", 13.1, -59.6, [(1, "country"), (2, "region")]),
+    (4, 2, "Other City", "locality", 13.2, -59.5, [(1, "country"), (2, "region")]),
+]
+
+
+@pytest.fixture
+def synthetic_db_path(tmp_path):
+    """Create a small database with the WhosOnFirst table layout."""
+    db_path = tmp_path / "whosonfirst-data-admin-xx-latest.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    for place_id, parent_id, name, placetype, lat, lon, ancestors in PLACES:
+        conn.execute(
+            "INSERT INTO spr (id, parent_id, name, placetype, country, repo, "
+            "latitude, longitude, is_current, is_deprecated, is_ceased, "
+            "superseded_by, supersedes, lastmodified) "
+            "VALUES (?, ?, ?, ?, 'XX', 'whosonfirst-data-admin-xx', ?, ?, "
+            "1, 0, 0, '[]', '[]', 1700000000)",
+            (place_id, parent_id, name, placetype, lat, lon),
+        )
+        for ancestor_id, ancestor_placetype in ancestors + [(place_id, placetype)]:
+            conn.execute(
+                "INSERT INTO ancestors VALUES (?, ?, ?, 1700000000)",
+                (place_id, ancestor_id, ancestor_placetype),
+            )
+        body = {
+            "type": "Feature",
+            "id": place_id,
+            "properties": {"wof:name": name},
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        }
+        conn.execute(
+            "INSERT INTO geojson VALUES (?, ?, 'whosonfirst', 0, '', 1700000000)",
+            (place_id, json.dumps(body)),
+        )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+@pytest_asyncio.fixture
+async def connector(synthetic_db_path):
+    """Connected SQLite connector over the synthetic database."""
+    connector = WOFConnector(str(synthetic_db_path))
+    await connector.connect()
+    yield connector
+    await connector.disconnect()
+
+
+# ============= POINT LOOKUP TESTS =============
+
+
+class TestPointLookups:
+    """Tests for get_place coalescing."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_concurrent_get_place_coalesced(self, connector, monkeypatch):
+        """Concurrent get_place calls share a single batch query."""
+        operations = connector.operations
+        calls = []
+        original = operations.execute_batch_query
+
+        async def spy(place_ids, include_geometry=False):
+            calls.append(list(place_ids))
+            return await original(place_ids, include_geometry)
+
+        monkeypatch.setattr(operations, "execute_batch_query", spy)
+
+        places = await asyncio.gather(
+            connector.get_place(3),
+            connector.get_place(4),
+            connector.get_place(3),
+            connector.get_place(999),
+        )
+
+        assert [p.id if p else None for p in places] == [3, 4, 3, None]
+        assert calls == [[3, 4, 999]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_place_geometry_lookups_batched_separately(self, connector):
+        """Geometry and plain lookups in the same tick resolve independently."""
+        plain, with_geometry = await asyncio.gather(
+            connector.get_place(3),
+            connector.get_place(3, include_geometry=True),
+        )
+
+        assert not hasattr(plain, "geometry") or plain.geometry is None
+        assert with_geometry.geometry is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_place_batch_error_reaches_every_waiter(
+        self, connector, monkeypatch
+    ):
+        """A failed batch query raises in every coalesced get_place call."""
+
+        async def failing(place_ids, include_geometry=False):
+            raise RuntimeError("database gone")
+
+        monkeypatch.setattr(connector.operations, "execute_batch_query", failing)
+
+        results = await asyncio.gather(
+            connector.get_place(3), connector.get_place(4), return_exceptions=True
+        )
+
+        assert [str(r) for r in results] == ["database gone", "database gone"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_place_batch_cancelled_releases_waiters(
+        self, connector, monkeypatch
+    ):
+        """Cancelling the shared batch cancels its waiters instead of hanging."""
+        operations = connector.operations
+        started = asyncio.Event()
+
+        async def blocked(place_ids, include_geometry=False):
+            started.set()
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(operations, "execute_batch_query", blocked)
+
+        waiters = asyncio.gather(
+            connector.get_place(3), connector.get_place(4), return_exceptions=True
+        )
+        await started.wait()
+        for task in list(operations._lookup_tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(waiters, timeout=1)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+# ============= BATCH LOOKUP TESTS =============
+
+
+class TestBatchLookups:
+    """Tests for get_places ordering."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_places_preserves_request_order(self, connector):
+        """get_places returns places in the order requested, missing IDs dropped."""
+        places = await connector.get_places([4, 1, 999, 3, 2])
+
+        assert [p.id for p in places] == [4, 1, 3, 2]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_places_order_across_chunks(self, connector):
+        """Order holds when the IDs span several concurrently fetched chunks."""
+        requested = [4] + list(range(1000, 3000)) + [1, 3]
+
+        places = await connector.get_places(requested)
+
+        assert [p.id for p in places] == [4, 1, 3]
+
+
+# ============= ANCESTOR TESTS =============
+
+
+class TestAncestorLookups:
+    """Tests for batched ancestor retrieval."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_ancestors_batch_matches_single(self, connector):
+        """Batched ancestors match per-place lookups, parent first."""
+        batch = await connector.get_ancestors_batch([3, 4, 1, 999])
+
+        assert set(batch) == {3, 4, 1, 999}
+        assert [a.id for a in batch[3]] == [2, 1]
+        assert batch[1] == [] and batch[999] == []
+        for place_id in (3, 4):
+            single = await connector.get_ancestors(place_id)
+            assert batch[place_id] == single
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_enrich_with_ancestors_uses_batch(self, connector, monkeypatch):
+        """enrich_with_ancestors resolves every place in one batch call."""
+        from wof_explorer.processing.collections import PlaceCollection
+
+        calls = []
+        original = connector.get_ancestors_batch
+
+        async def spy(place_ids):
+            calls.append(list(place_ids))
+            return await original(place_ids)
+
+        monkeypatch.setattr(connector, "get_ancestors_batch", spy)
+
+        collection = PlaceCollection(places=await connector.get_places([3, 4]))
+        await collection.enrich_with_ancestors(connector)
+
+        assert calls == [[3, 4]]
+        ancestor_data = collection.metadata["ancestor_data"]
+        assert [a["name"] for a in ancestor_data[4]] == ["Test Region", "Testland"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_hierarchy_cursor_shares_ancestor_lookup(
+        self, connector, monkeypatch
+    ):
+        """Concurrent hierarchy calls wait on one ancestor lookup."""
+        from wof_explorer.processing.cursors import WOFHierarchyCursor
+
+        calls = []
+        original = connector.get_ancestors
+
+        async def spy(place_id):
+            calls.append(place_id)
+            return await original(place_id)
+
+        monkeypatch.setattr(connector, "get_ancestors", spy)
+
+        hierarchy = WOFHierarchyCursor(await connector.get_place(3), connector)
+        ancestors, siblings, again = await asyncio.gather(
+            hierarchy.fetch_ancestors(),
+            hierarchy.fetch_siblings(),
+            hierarchy.fetch_ancestors(),
+        )
+
+        assert calls == [3]
+        assert [a.id for a in ancestors] == [a.id for a in again] == [2, 1]
+        assert [s.id for s in siblings] == [4]
+
+
+# ============= READ POOL TESTS =============
+
+
+class TestReadPool:
+    """Tests for the pooled reader connections."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_concurrent_searches_use_separate_connections(self, connector):
+        """Gathered searches check out distinct pooled connections."""
+        from wof_explorer.backends.sqlite.session import READ_POOL_SIZE
+        from wof_explorer.models.filters import WOFSearchFilters
+
+        engine = connector.session_manager.get_async_engine()
+        assert engine.pool.size() == READ_POOL_SIZE
+
+        cursors = await asyncio.gather(
+            connector.search(WOFSearchFilters(placetype="locality")),
+            connector.search(WOFSearchFilters(placetype="region")),
+        )
+
+        assert [len(c.places) for c in cursors] == [2, 1]
+        assert engine.pool.checkedout() == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_connections_are_read_only(self, connector):
+        """Pooled connections refuse writes to the source database."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+
+        engine = connector.session_manager.get_async_engine()
+        async with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("DELETE FROM spr"))
+
+
+# ============= BBOX SEARCH TESTS =============
+
+
+class TestBBoxSearch:
+    """Tests for bbox searches with and without the R*Tree index."""
+
+    @staticmethod
+    async def _bbox_ids(db_path, bbox):
+        from wof_explorer.models.filters import WOFSearchFilters
+
+        connector = WOFConnector(str(db_path))
+        await connector.connect()
+        try:
+            cursor = await connector.search(WOFSearchFilters(bbox=bbox))
+            return sorted(p.id for p in cursor.places)
+        finally:
+            await connector.disconnect()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_rtree_never_drops_places(self, synthetic_db_path, tmp_path):
+        """Places missing from the R*Tree still match on their centroid."""
+        bbox = (-59.65, 13.05, -59.45, 13.25)
+        expected = await self._bbox_ids(synthetic_db_path, bbox)
+
+        # Only the region has a polygon in the index; both cities are
+        # point-only places with no R*Tree row
+        indexed_path = tmp_path / "indexed" / synthetic_db_path.name
+        indexed_path.parent.mkdir()
+        indexed_path.write_bytes(synthetic_db_path.read_bytes())
+        conn = sqlite3.connect(indexed_path)
+        conn.execute(
+            "CREATE VIRTUAL TABLE rtree USING rtree("
+            "id, min_x, max_x, min_y, max_y, +wof_id INTEGER, +is_alt TINYINT, "
+            "+alt_label TEXT, +geometry BLOB, +lastmodified INTEGER)"
+        )
+        conn.execute(
+            "INSERT INTO rtree VALUES (1, -59.7, -59.5, 13.0, 13.2, 2, 0, '', "
+            "NULL, 1700000000)"
+        )
+        conn.commit()
+        conn.close()
+
+        assert expected == [2, 3, 4]
+        assert await self._bbox_ids(indexed_path, bbox) == expected
+
+
+# ============= GEOMETRY TESTS =============
+
+
+class TestGeometryFetch:
+    """Tests for geometry-only retrieval."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_geometries_returns_mapping(self, connector):
+        """get_geometries maps place IDs to parsed GeoJSON."""
+        geometries = await connector.get_geometries([3, 4, 999])
+
+        assert set(geometries) == {3, 4}
+        assert geometries[3]["geometry"]["type"] == "Point"
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_get_geometry_ids_matches_get_geometries(self, connector):
+        """get_geometry_ids reports the same places without decoding them."""
+        assert await connector.get_geometry_ids([3, 4, 999]) == {3, 4}
+        assert await connector.get_geometry_ids([]) == set()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_fetch_all_with_geometry_skips_spr_refetch(
+        self, connector, monkeypatch
+    ):
+        """fetch_all(include_geometry=True) only reads geometry."""
+        from wof_explorer.models.filters import WOFSearchFilters
+        from wof_explorer.models.places import WOFPlaceWithGeometry
+
+        cursor = await connector.search(WOFSearchFilters(placetype="locality"))
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("SPR rows should not be re-fetched")
+
+        monkeypatch.setattr(connector, "get_places", fail)
+
+        collection = await cursor.fetch_all(include_geometry=True)
+
+        assert [p.id for p in collection.places] == [p.id for p in cursor.places]
+        assert all(isinstance(p, WOFPlaceWithGeometry) for p in collection.places)
+        assert all(p.geometry is not None for p in collection.places)
+        assert collection.places[0].name == cursor.places[0].name
@@ -186,6 +186,43 @@ class TestSpatialQueries:
         assert "-59.65" in compiled
         assert "-59.42" in compiled
 
+    @pytest.mark.unit
+    def test_apply_bbox_filter_uses_rtree_when_available(self, mock_tables):
+        """BBox filter should narrow candidates through the R*Tree index."""
+        rtree = Table(
+            "rtree",
+            mock_tables["spr"].metadata,
+            Column("id", Integer, primary_key=True),
+            Column("min_x", Float),
+            Column("max_x", Float),
+            Column("min_y", Float),
+            Column("max_y", Float),
+            Column("wof_id", Integer),
+        )
+        builder = SQLiteQueryBuilder({**mock_tables, "rtree": rtree})
+        bbox = (-59.65, 13.04, -59.42, 13.33)
+
+        filtered_query = builder._apply_bbox_filter(select(mock_tables["spr"]), bbox)
+
+        compiled = str(filtered_query.compile(compile_kwargs={"literal_binds": True}))
+        assert "rtree.wof_id" in compiled
+        assert "rtree.min_x <= -59.42" in compiled
+        assert "rtree.max_y >= 13.04" in compiled
+        # Centroid test is kept, and places the index lacks are not dropped
+        assert "spr.latitude >= 13.04" in compiled
+        assert "spr.id NOT IN" in compiled
+
+    @pytest.mark.unit
+    def test_apply_bbox_filter_without_rtree(self, query_builder, mock_tables):
+        """BBox filter should fall back to a plain scan without R*Tree."""
+        bbox = (-59.65, 13.04, -59.42, 13.33)
+
+        filtered_query = query_builder._apply_bbox_filter(
+            select(mock_tables["spr"]), bbox
+        )
+
+        assert "rtree" not in str(filtered_query)
+
     @pytest.mark.unit
     def test_apply_proximity_filter(self, query_builder, mock_tables):
         """Proximity filter should add distance-based conditions."""
@@ -580,6 +617,18 @@ class TestSearchQueryBuilding:
         assert "name" in compiled.lower()
         assert "bridgetown" in compiled.lower()
 
+    @pytest.mark.unit
+    def test_build_search_query_with_name_list(self, query_builder):
+        """A list of names becomes one exact-match IN clause."""
+        filters = WOFSearchFilters(name=["Bridgetown", "Holetown"])
+
+        query = query_builder.build_search_query(filters)
+
+        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
+        assert "spr.name IN ('Bridgetown', 'Holetown')" in compiled
+        assert "like" not in compiled.lower()
+        assert "names" not in compiled.lower()
+
     @pytest.mark.unit
     def test_build_search_query_name_without_names_table(
         self, query_builder_no_names
@@ -846,3 +895,61 @@ class TestEdgeCases:
 
         compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
         assert "region" in compiled.lower()
+
+
+# ============= SEARCH SQL CACHE TESTS =============
+
+
+class TestSearchSQLCache:
+    """Test caching of rendered search SQL by filter shape."""
+
+    @pytest.mark.unit
+    def test_same_shape_shares_sql(self, query_builder):
+        """Filters differing only in values render the same cached SQL."""
+        first = WOFSearchFilters(placetype="locality", region="A", limit=20)
+        second = WOFSearchFilters(placetype="region", region="B", limit=5)
+
+        sql = query_builder.render_search_query(
+            first, query_builder.build_search_query(first)
+        )
+
+        assert sql == str(query_builder.build_search_query(second))
+        assert query_builder.search_shape(first) == query_builder.search_shape(second)
+        assert (
+            query_builder.render_search_query(
+                second, query_builder.build_search_query(second)
+            )
+            is sql
+        )
+
+    @pytest.mark.unit
+    def test_different_shapes_render_separately(self, query_builder):
+        """Setting a different set of filters renders a different statement."""
+        regional = WOFSearchFilters(region="A")
+        named = WOFSearchFilters(region="A", name="Bridge")
+
+        assert query_builder.search_shape(regional) != query_builder.search_shape(named)
+        assert query_builder.render_search_query(
+            regional, query_builder.build_search_query(regional)
+        ) != query_builder.render_search_query(
+            named, query_builder.build_search_query(named)
+        )
+
+    @pytest.mark.unit
+    def test_cache_is_bounded(self, query_builder, monkeypatch):
+        """The least recently used shape is evicted once the cache is full."""
+        from wof_explorer.backends.sqlite import queries
+
+        monkeypatch.setattr(queries, "SEARCH_SQL_CACHE_SIZE", 2)
+        shapes = [
+            WOFSearchFilters(region="A"),
+            WOFSearchFilters(country="BB"),
+            WOFSearchFilters(parent_id=1),
+        ]
+        for filters in shapes:
+            query_builder.render_search_query(
+                filters, query_builder.build_search_query(filters)
+            )
+
+        cached = list(query_builder._search_sql)
+        assert cached == [query_builder.search_shape(f) for f in shapes[1:]]
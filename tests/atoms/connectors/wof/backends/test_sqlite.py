@@ -366,6 +366,27 @@ class TestSQLiteSpecific:
 
         await sqlite_connector.disconnect()
 
+    @pytest.mark.asyncio
+    async def test_sqlite_connection_pragmas(self, sqlite_connector):
+        """Test that pooled connections are configured with tuning pragmas."""
+        from sqlalchemy import text
+
+        await sqlite_connector.connect()
+
+        engine = sqlite_connector.session_manager.get_async_engine()
+        async with engine.connect() as conn:
+            cache_size = (await conn.execute(text("PRAGMA cache_size"))).scalar()
+            temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+            query_only = (await conn.execute(text("PRAGMA query_only"))).scalar()
+            mmap_size = (await conn.execute(text("PRAGMA mmap_size"))).scalar()
+
+        assert cache_size == -64000
+        assert temp_store == 2  # MEMORY
+        assert query_only == 1
+        assert mmap_size == 256 << 20
+
+        await sqlite_connector.disconnect()
+
     @pytest.mark.asyncio
     async def test_sqlite_error_handling(self, tmp_path):
         """Test SQLite error handling for invalid databases."""
@@ -310,6 +310,19 @@ class BaseWOFConnectorContract:
             assert len(places) <= 2  # May return fewer if some don't exist
             assert all(isinstance(p, WOFPlace) for p in places)
 
+    @pytest.mark.asyncio
+    async def test_get_places_preserves_order(self, connector, test_data):
+        """Batch retrieval must return places in the requested order."""
+        await connector.connect()
+
+        # Both IDs exist in the test database, ordered locality first
+        requested = [test_data.toronto_id, test_data.canada_id]
+        places = await connector.get_places(requested)
+        assert [p.id for p in places] == requested
+
+        places = await connector.get_places(list(reversed(requested)))
+        assert [p.id for p in places] == list(reversed(requested))
+
     # ============= HIERARCHY CONTRACT =============
 
     @pytest.mark.asyncio
@@ -51,6 +51,23 @@ class TestWOFPlaceConstruction:
         assert place.area_m2 == 39000000.0
         assert place.source == "whosonfirst"
 
+    @pytest.mark.unit
+    def test_place_area_sqkm_derived(self):
+        """area_sqkm is derived from area_m2, so it can be read without probing."""
+        place = WOFPlace(
+            id=BRIDGETOWN_LOCALITY_ID, name="Bridgetown", placetype="locality"
+        )
+        assert place.area_sqkm is None
+
+        place = WOFPlace(
+            id=BRIDGETOWN_LOCALITY_ID,
+            name="Bridgetown",
+            placetype="locality",
+            area_m2=39000000.0,
+        )
+        assert place.area_sqkm == 39.0
+        assert "area_sqkm" not in place.model_dump()
+
     @pytest.mark.unit
     def test_place_with_geometry(self):
         """Place can store bbox and centroid."""
@@ -8,13 +8,15 @@ contract tests in test_collection_contract.py.
 
 import pytest
 import pytest_asyncio
+import csv
+import io
 import json
 import random
 from pathlib import Path
 
 from wof_explorer.backends.sqlite import SQLiteWOFConnector as WOFConnector
 from wof_explorer.processing.collections import PlaceCollection
-from wof_explorer.models.places import WOFPlace
+from wof_explorer.models.places import WOFPlace, WOFPlaceWithGeometry
 from wof_explorer.models.filters import WOFSearchFilters
 from wof_explorer.types import PlaceType
 
@@ -406,6 +408,177 @@ class TestPlaceCollectionSerialization:
         data = collection.to_dict()
         assert data["count"] == 0
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_write_geojson_matches_reference(self, mock_places, tmp_path, indent):
+        """Streamed GeoJSON decodes to the FeatureCollection to_geojson() builds."""
+        collection = PlaceCollection(places=mock_places)
+        path = tmp_path / "out" / "places.geojson"
+
+        collection.write_geojson(path, indent=indent)
+
+        text = path.read_text(encoding="utf-8")
+        document = json.loads(text)
+        assert document == collection.to_geojson()
+        assert document["type"] == "FeatureCollection"
+        assert [f["id"] for f in document["features"]] == [1, 2, 3]
+        assert [f["properties"]["name"] for f in document["features"]] == [
+            "Test Locality",
+            "Test Region",
+            "Test Neighbourhood",
+        ]
+        if indent is None:
+            assert "\n" not in text
+        else:
+            assert text.startswith(
+                '{\n  "type": "FeatureCollection",\n  "features": [\n    {\n'
+            )
+
+    @pytest.mark.unit
+    def test_geojson_string_keeps_coordinates_compact(self):
+        """Indented output keeps coordinate arrays on one line."""
+        ring = [[-59.6, 13.1], [-59.5, 13.1], [-59.5, 13.2], [-59.6, 13.1]]
+        place = WOFPlaceWithGeometry(
+            id=1,
+            name="Test Polygon",
+            placetype=PlaceType.LOCALITY,
+            centroid=[-59.55, 13.15],
+            geometry={"type": "Polygon", "coordinates": [ring]},
+        )
+        collection = PlaceCollection(places=[place])
+
+        geojson_str = collection.to_geojson_string(indent=2)
+
+        assert json.dumps([ring]) in geojson_str
+        parsed = json.loads(geojson_str)
+        assert parsed["features"][0]["geometry"]["coordinates"] == [ring]
+        assert parsed == json.loads(collection.to_geojson_string(indent=None))
+
+    @pytest.mark.unit
+    def test_geojson_quantize_round_trip(self):
+        """Quantized output decodes back to the original coordinates."""
+        ring = [[-59.6, 13.1], [-59.5, 13.1], [-59.5, 13.2], [-59.6, 13.1]]
+        place = WOFPlaceWithGeometry(
+            id=1,
+            name="Test Polygon",
+            placetype=PlaceType.LOCALITY,
+            centroid=[-59.55, 13.15],
+            geometry={"type": "Polygon", "coordinates": [ring]},
+        )
+        collection = PlaceCollection(places=[place])
+
+        parsed = json.loads(collection.to_geojson_string(quantize=True))
+
+        transform = parsed["transform"]
+        assert transform["translate"] == [-59.6, 13.1]
+        (sx, sy), (tx, ty) = transform["scale"], transform["translate"]
+        quantized = parsed["features"][0]["geometry"]["coordinates"][0]
+        assert all(isinstance(v, int) for pos in quantized for v in pos)
+        for (qx, qy), (x, y) in zip(quantized, ring):
+            assert qx * sx + tx == pytest.approx(x)
+            assert qy * sy + ty == pytest.approx(y)
+
+        # Unquantized output is unchanged
+        assert "transform" not in json.loads(collection.to_geojson_string())
+
+    @pytest.mark.unit
+    def test_write_geojson_to_file_object(self, tmp_path):
+        """write_geojson accepts an open file and handles empty collections."""
+        collection = PlaceCollection(places=[])
+        path = tmp_path / "empty.geojson"
+
+        with open(path, "w", encoding="utf-8") as f:
+            collection.write_geojson(f)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["features"] == []
+
+    @pytest.mark.unit
+    def test_geojson_bytes_matches_string(self, mock_places):
+        """to_geojson_bytes returns the UTF-8 encoding of to_geojson_string."""
+        collection = PlaceCollection(places=mock_places)
+
+        data = collection.to_geojson_bytes()
+
+        assert isinstance(data, bytes)
+        assert data == collection.to_geojson_string().encode("utf-8")
+
+    @pytest.mark.unit
+    def test_compact_geojson_matches_stdlib_encoding(self):
+        """Compact output is exactly json.dumps of the FeatureCollection dict."""
+        place = WOFPlaceWithGeometry(
+            id=1,
+            name="Montréal",
+            placetype=PlaceType.LOCALITY,
+            geometry={
+                "type": "Polygon",
+                "coordinates": [[[1e-07, 0.0], [-4.8e-05, 13.1], [1e-07, 0.0]]],
+            },
+        )
+        collection = PlaceCollection(places=[place])
+
+        compact = collection.to_geojson_string(indent=None)
+        indented = collection.to_geojson_string(indent=2)
+
+        assert compact == json.dumps(collection.to_geojson())
+        # Float formatting, separators and escaping are the same when indented
+        for text in (compact, indented):
+            assert "[[[1e-07, 0.0], [-4.8e-05, 13.1], [1e-07, 0.0]]]" in text
+            assert '"name": "Montr\\u00e9al"' in text
+
+    @pytest.mark.unit
+    def test_estimated_geojson_bytes_tracks_output(self):
+        """The size estimate scales with vertices and stays near the real size."""
+        ring = [[-59.6 + i * 1e-4, 13.1 + i * 1e-4] for i in range(200)]
+        places = [
+            WOFPlaceWithGeometry(
+                id=i,
+                name=f"Place {i}",
+                placetype=PlaceType.LOCALITY,
+                centroid=[-59.55, 13.15],
+                geometry={"type": "Polygon", "coordinates": [ring]},
+            )
+            for i in range(10)
+        ]
+        collection = PlaceCollection(places=places)
+
+        estimate = collection.estimated_geojson_bytes()
+        actual = len(collection.to_geojson_bytes(indent=None))
+
+        assert 0.5 * actual < estimate < 2 * actual
+        assert PlaceCollection(places=places[:1]).estimated_geojson_bytes() < estimate
+        assert collection.estimated_geojson_bytes(require_geometry=True) == estimate
+
+    @pytest.mark.unit
+    def test_csv_string_matches_rows(self, mock_places):
+        """to_csv_string writes a header and one line per csv row."""
+        collection = PlaceCollection(places=mock_places)
+
+        text = collection.to_csv_string()
+
+        rows = list(csv.DictReader(io.StringIO(text)))
+        expected = collection.to_csv_rows()
+        assert list(rows[0].keys()) == list(expected[0].keys())
+        assert [r["id"] for r in rows] == [str(r["id"]) for r in expected]
+        assert rows[0]["min_lat"] == ""
+
+    @pytest.mark.unit
+    def test_csv_string_custom_columns(self):
+        """Any bbox column pulls in all four bbox columns, as in to_csv_rows."""
+        place = WOFPlace(
+            id=1,
+            name="Boxed",
+            placetype=PlaceType.LOCALITY,
+            bbox=[-59.7, 13.0, -59.4, 13.3],
+        )
+        collection = PlaceCollection(places=[place])
+
+        text = collection.to_csv_string(columns=["id", "max_lat"])
+
+        header, row = text.splitlines()
+        assert header == "id,min_lat,min_lon,max_lat,max_lon"
+        assert row == "1,13.0,-59.7,13.3,-59.4"
+        assert PlaceCollection(places=[]).to_csv_string() == ""
+
 
 # ============= PlaceCollection Filtering Unit Tests =============
 
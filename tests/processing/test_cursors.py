@@ -220,6 +220,21 @@ class TestWOFSearchCursor:
                 if len(page1.places) > 0 and len(page2.places) > 0:
                     assert page1.places[0].id != page2.places[0].id
 
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_search_cursor_iter_chunks(self, connector):
+        """iter_chunks should stream every place in cursor order."""
+        cursor = await connector.search(WOFSearchFilters(limit=10))
+
+        chunks = []
+        async for chunk in cursor.iter_chunks(chunk_size=3):
+            assert all(isinstance(p, WOFPlace) for p in chunk)
+            assert len(chunk) <= 3
+            chunks.append(chunk)
+
+        streamed = [p.id for chunk in chunks for p in chunk]
+        assert streamed == [p.id for p in cursor.places]
+
     @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_search_cursor_fetch_by_ids(self, connector):
@@ -0,0 +1,200 @@
+"""
+Tests for the caches in scripts/wof-explore.py.
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The script's own CLI dependencies
+pytest.importorskip("nest_asyncio")
+pytest.importorskip("prompt_toolkit")
+
+SCRIPT_PATH = Path(__file__).parent.parent.parent / "scripts" / "wof-explore.py"
+
+
+@pytest.fixture(scope="module")
+def wof_explore():
+    """The wof-explore script loaded as a module."""
+    spec = importlib.util.spec_from_file_location("wof_explore_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point XDG_CACHE_HOME at a temporary directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Stand-in database file; only its mtime and size are read."""
+    database = tmp_path / "whosonfirst-data-admin-xx-latest.db"
+    database.write_bytes(b"x" * 100)
+    return database
+
+
+class FakeConnector:
+    """Connector whose explorer counts database_summary() calls."""
+
+    def __init__(self, summary=None):
+        self.calls = 0
+        self.summary = summary or {"total_places": 4, "by_placetype": {"locality": 2}}
+        self.explorer = SimpleNamespace(database_summary=self._database_summary)
+
+    async def _database_summary(self):
+        self.calls += 1
+        return self.summary
+
+
+def test_cache_path_honours_xdg_cache_home(wof_explore, cache_home):
+    assert wof_explore.summary_cache_path() == (
+        cache_home / "wof-explorer" / "summary.json"
+    )
+
+
+def test_cache_path_defaults_to_home(wof_explore, monkeypatch):
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert wof_explore.summary_cache_path() == (
+        Path.home() / ".cache" / "wof-explorer" / "summary.json"
+    )
+
+
+async def test_summary_cached_across_calls(wof_explore, cache_home, database):
+    connector = FakeConnector()
+
+    first = await wof_explore.load_database_summary(connector, database)
+    second = await wof_explore.load_database_summary(connector, database)
+
+    assert first == second == {"total_places": 4, "by_placetype": {"locality": 2}}
+    assert connector.calls == 1
+
+    cache_path = wof_explore.summary_cache_path()
+    assert str(database.resolve()) in json.loads(cache_path.read_text())
+    # The write goes through a temporary file that is swapped into place
+    assert list(cache_path.parent.iterdir()) == [cache_path]
+
+
+async def test_summary_miss_matches_hit(wof_explore, cache_home, database):
+    # JSON object keys are always strings, so a None placetype can't survive
+    # the cache as None; a miss returns the same shape a later hit will
+    connector = FakeConnector(
+        {"total_places": 3, "by_placetype": {"locality": 2, None: 1}}
+    )
+
+    first = await wof_explore.load_database_summary(connector, database)
+    second = await wof_explore.load_database_summary(connector, database)
+
+    assert (
+        first
+        == second
+        == {
+            "total_places": 3,
+            "by_placetype": {"locality": 2, "null": 1},
+        }
+    )
+    assert connector.calls == 1
+
+
+async def test_summary_refreshed_when_mtime_changes(wof_explore, cache_home, database):
+    connector = FakeConnector()
+    await wof_explore.load_database_summary(connector, database)
+
+    stat = database.stat()
+    os.utime(database, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    await wof_explore.load_database_summary(connector, database)
+
+    assert connector.calls == 2
+
+
+async def test_summary_refreshed_when_size_changes(wof_explore, cache_home, database):
+    connector = FakeConnector()
+    await wof_explore.load_database_summary(connector, database)
+
+    stat = database.stat()
+    with open(database, "ab") as f:
+        f.write(b"more")
+    os.utime(database, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    await wof_explore.load_database_summary(connector, database)
+
+    assert connector.calls == 2
+
+
+@pytest.mark.parametrize(
+    "make_cache",
+    [
+        lambda key, stamp: "{not json",
+        lambda key, stamp: "[1, 2, 3]",
+        lambda key, stamp: json.dumps({key: "not an entry"}),
+        lambda key, stamp: json.dumps({key: {"stamp": stamp, "summary": None}}),
+    ],
+    ids=["invalid-json", "not-a-dict", "bad-entry", "bad-summary"],
+)
+async def test_corrupt_cache_is_a_miss(wof_explore, cache_home, database, make_cache):
+    stat = database.stat()
+    cache_path = wof_explore.summary_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        make_cache(str(database.resolve()), [stat.st_mtime_ns, stat.st_size])
+    )
+    connector = FakeConnector()
+
+    summary = await wof_explore.load_database_summary(connector, database)
+
+    assert summary == {"total_places": 4, "by_placetype": {"locality": 2}}
+    assert connector.calls == 1
+    # The corrupt file is replaced with a valid cache
+    assert str(database.resolve()) in json.loads(cache_path.read_text())
+
+
+class FakeSearchConnector:
+    """Connector answering name searches from a fixed table."""
+
+    def __init__(self, results):
+        self.results = results
+        self.searches = []
+
+    async def search(self, filters):
+        self.searches.append(filters.name)
+        return SimpleNamespace(places=self.results.get(filters.name.lower(), []))
+
+
+def fake_place(name):
+    return SimpleNamespace(name=name, placetype="locality", country="XX")
+
+
+async def test_completer_narrows_earlier_results(wof_explore):
+    connector = FakeSearchConnector({"br": [fake_place("Bridgetown")]})
+    completer = wof_explore.PlaceCompleter(connector)
+
+    await completer._search("br")
+    places = await completer._search("bri")
+
+    assert [p.name for p in places] == ["Bridgetown"]
+    assert connector.searches == ["br"]
+
+
+async def test_completer_searches_again_after_alternate_name_match(wof_explore):
+    # Holetown matches on an alternate name, which places don't carry
+    speightstown = fake_place("Speightstown")
+    connector = FakeSearchConnector(
+        {
+            "sp": [speightstown, fake_place("Holetown")],
+            "spe": [speightstown, fake_place("Holetown")],
+        }
+    )
+    completer = wof_explore.PlaceCompleter(connector)
+
+    await completer._search("sp")
+    places = await completer._search("spe")
+
+    assert [p.name for p in places] == ["Speightstown", "Holetown"]
+    assert connector.searches == ["sp", "spe"]
@@ -139,9 +139,9 @@ def test_batch_processing_fix():
         "batch_cursor.process_in_chunks" not in content
     ), "batch_processing.py still has the cursor bug - should use cursor, not batch_cursor"
 
-    # Should have proper chunked processing
+    # Should have proper chunked processing, streamed from the search cursor
     assert (
-        "for i in range(0, len(" in content
+        "async for chunk in cursor.iter_chunks(" in content
     ), "Missing proper chunked processing implementation"
 
     print("✓ batch_processing.py cursor bug has been fixed")